@@ -0,0 +1,125 @@
+"""
+Concurrent, resumable evaluation engine for prompt comparison
+Runs predict_rating calls on a bounded thread pool and checkpoints every
+finished (prompt, row) result to an append-only JSONL file. Results are keyed by
+a hash of the prompt template, model and temperature, so editing any of them
+re-runs the affected prompt instead of reusing stale results
+"""
+
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def config_hash(prompt_template, model=None, temperature=None):
+    """Short fingerprint of everything that changes a prediction besides the review"""
+    payload = json.dumps([prompt_template, model, temperature])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """Append-only JSONL log of finished (prompt, row) results"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def load(self, retry_invalid=False):
+        """Return {(prompt_name, config_hash, row_id): record} for results already on disk"""
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                if retry_invalid and not record.get('is_valid'):
+                    continue
+                # Records written before config hashes existed never match and are re-run
+                done[(record['prompt_name'], record.get('config_hash'), str(record['row_id']))] = record
+        return done
+    
+    def append(self, record):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def run_evaluation(rows, prompts, predict_fn, checkpoint_path, model=None, temperature=None,
+                   max_workers=8, retry_invalid=False, progress_every=20):
+    """
+    Evaluate every prompt on every row with bounded concurrency
+    
+    rows: list of dicts with 'row_id', 'text' and 'stars'
+    prompts: {prompt_name: prompt_template}
+    predict_fn: predict_rating(review_text, prompt_template) -> result dict
+    model, temperature: settings predict_fn calls the LLM with (part of the checkpoint key)
+    
+    Returns {prompt_name: [result, ...]} in row order, including results
+    restored from the checkpoint file
+    """
+    store = CheckpointStore(checkpoint_path)
+    done = store.load(retry_invalid=retry_invalid)
+    hashes = {
+        prompt_name: config_hash(prompt_template, model, temperature)
+        for prompt_name, prompt_template in prompts.items()
+    }
+    
+    tasks = [
+        (prompt_name, prompt_template, row)
+        for prompt_name, prompt_template in prompts.items()
+        for row in rows
+        if (prompt_name, hashes[prompt_name], str(row['row_id'])) not in done
+    ]
+    total = len(prompts) * len(rows)
+    print(f"✓ {total - len(tasks)}/{total} results restored from {checkpoint_path}, {len(tasks)} to run")
+    
+    def evaluate(prompt_name, prompt_template, row):
+        result = predict_fn(row['text'], prompt_template)
+        record = dict(result)
+        record['prompt_name'] = prompt_name
+        record['config_hash'] = hashes[prompt_name]
+        record['row_id'] = row['row_id']
+        record['actual_stars'] = row['stars']
+        store.append(record)
+        return record
+    
+    completed = 0
+    task_iter = iter(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Keep a bounded window of in-flight calls instead of queueing every task up front
+        in_flight = set()
+        for prompt_name, prompt_template, row in task_iter:
+            in_flight.add(executor.submit(evaluate, prompt_name, prompt_template, row))
+            if len(in_flight) >= max_workers * 2:
+                break
+        
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                record = future.result()
+                done[(record['prompt_name'], record['config_hash'], str(record['row_id']))] = record
+                completed += 1
+                if completed % progress_every == 0:
+                    print(f"Processed {completed}/{len(tasks)} predictions...")
+                
+                next_task = next(task_iter, None)
+                if next_task is not None:
+                    in_flight.add(executor.submit(evaluate, *next_task))
+    
+    return {
+        prompt_name: [done[(prompt_name, hashes[prompt_name], str(row['row_id']))] for row in rows]
+        for prompt_name in prompts
+    }
@@ -2,10 +2,18 @@
 Full evaluation script using Groq API
 Evaluates 3 prompts on 200 Yelp reviews
 Much faster than Gemini - estimated time: 5-10 minutes
+
+Predictions run concurrently and are checkpointed to a JSONL file;
+re-running the script resumes from the checkpoint.
+Set LLM_BACKEND=stub to run offline against the TASK2 stub backend.
+
+Usage: python evaluate_with_groq.py [--sample-size 200] [--workers 8]
+                                    [--checkpoint evaluation_checkpoint.jsonl] [--retry-invalid]
 """
 
 import os
-from groq import Groq
+import sys
+import argparse
 import pandas as pd
 import json
 import time
@@ -13,18 +21,36 @@ import numpy as np
 from sklearn.metrics import accuracy_score, confusion_matrix
 from dotenv import load_dotenv
 
+# Share the LLM backends and Groq request/token budget with the TASK2 API service
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'TASK2'))
+from llm_backends import create_backend
+from eval_engine import run_evaluation
+
+# Generation settings; part of the checkpoint key, so changing them re-runs every prompt
+MODEL = "llama-3.3-70b-versatile"
+TEMPERATURE = 0.1
+
+# Command line options
+parser = argparse.ArgumentParser(description="Evaluate rating prediction prompts with Groq")
+parser.add_argument("--sample-size", type=int, default=200, help="Number of Yelp reviews to evaluate")
+parser.add_argument("--workers", type=int, default=8, help="Concurrent Groq calls")
+parser.add_argument("--checkpoint", default="evaluation_checkpoint.jsonl", help="JSONL file used to resume runs")
+parser.add_argument("--retry-invalid", action="store_true", help="Re-run checkpointed predictions that failed")
+args = parser.parse_args()
+
 # Load environment
 load_dotenv()
 
-# Initialize Groq
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-client = Groq(api_key=GROQ_API_KEY)
-print("✓ Groq client initialized")
-print("✓ Using model: llama-3.3-70b-versatile")
+# Initialize LLM backend (Groq, rate limited by the shared token bucket)
+backend = create_backend()
+if backend is None:
+    sys.exit("GROQ_API_KEY not found in environment variables")
+print(f"✓ {backend.name} backend initialized")
+print(f"✓ Using model: {MODEL}")
 
 # Load data
 df = pd.read_csv('yelp.csv')
-df_sample = df.sample(n=200, random_state=42).reset_index(drop=True)
+df_sample = df.sample(n=args.sample_size, random_state=42).reset_index(drop=True)
 print(f"✓ Loaded {len(df_sample)} reviews for evaluation")
 
 # Define prompts
@@ -80,13 +106,9 @@ def predict_rating(review_text, prompt_template, max_retries=2):
     
     for attempt in range(max_retries):
         try:
-            chat_completion = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model="llama-3.3-70b-versatile",
-                temperature=0.1,
-            )
-            
-            response_text = chat_completion.choices[0].message.content.strip()
+            # The backend waits for rate limit budget instead of running into 429s
+            completion = backend.complete(prompt, MODEL, TEMPERATURE)
+            response_text = completion.text
             
             # Clean up markdown code blocks
             if "```json" in response_text:
@@ -154,31 +176,31 @@ def calculate_consistency(predictions):
     return np.std(errors)
 
 # Run evaluation
-results = {}
+# Stable row ids keep checkpoints valid across runs
+id_column = 'review_id' if 'review_id' in df_sample.columns else None
+rows = [
+    {
+        'row_id': row[id_column] if id_column else idx,
+        'text': row['text'],
+        'stars': int(row['stars'])
+    }
+    for idx, row in df_sample.iterrows()
+]
+
+results = run_evaluation(
+    rows,
+    prompts,
+    predict_rating,
+    checkpoint_path=args.checkpoint,
+    model=MODEL,
+    temperature=TEMPERATURE,
+    max_workers=args.workers,
+    retry_invalid=args.retry_invalid
+)
 
-for prompt_name, prompt_template in prompts.items():
-    print(f"\n{'='*60}")
-    print(f"Testing: {prompt_name}")
-    print(f"{'='*60}")
-    
-    predictions = []
-    valid_count = 0
-    
-    for idx, row in df_sample.iterrows():
-        result = predict_rating(row['text'], prompt_template)
-        result['actual_stars'] = row['stars']
-        predictions.append(result)
-        
-        if result['is_valid']:
-            valid_count += 1
-        
-        if (idx + 1) % 20 == 0:
-            print(f"Processed {idx + 1}/{len(df_sample)} reviews...")
-        
-        time.sleep(0.1)  # Groq rate limiting (very generous)
-    
-    results[prompt_name] = predictions
-    print(f"Completed! Valid JSON responses: {valid_count}/{len(df_sample)}")
+for prompt_name, predictions in results.items():
+    valid_count = sum(1 for p in predictions if p['is_valid'])
+    print(f"{prompt_name}: Valid JSON responses: {valid_count}/{len(predictions)}")
 
 # Calculate and display metrics
 print("\n" + "="*70)
@@ -1,9 +1,20 @@
-from groq import Groq
 import os
+import re
+import json
+import asyncio
 from dotenv import load_dotenv
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Optional
 import logging
+from pydantic import ValidationError
+
+from models import ReviewInsights
+from llm_cache import llm_cache, make_cache_key
+from resilience import RetryPolicy, CircuitBreaker, get_retry_after
+from llm_backends import create_backend, RateLimitTimeout
+import metrics
 
 load_dotenv()
 
@@ -11,47 +22,299 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Groq client
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-if not GROQ_API_KEY:
-    # Fallback to check GEMINI_API_KEY just in case, but GROQ is preferred now
-    GROQ_API_KEY = os.getenv("GEMINI_API_KEY")
-    if not GROQ_API_KEY:
-        logger.warning("GROQ_API_KEY not found in environment variables")
+# Run the three per-review LLM calls in parallel instead of back to back
+AI_CONCURRENT_CALLS = os.getenv("AI_CONCURRENT_CALLS", "true").lower() == "true"
+# Sync endpoints run on Starlette's threadpool, which anyio limits to 40 threads
+SERVER_THREAD_LIMIT = 40
+# LLM calls one sync submission fans out to the pool (response, summary, actions, severity)
+CALLS_PER_SUBMISSION = 4
+# Upper bound on in-flight LLM calls across all requests in this process; the default lets
+# every server thread fan out at once, and Groq itself is throttled by the rate limiter
+AI_MAX_WORKERS = int(os.getenv("AI_MAX_WORKERS", str(SERVER_THREAD_LIMIT * CALLS_PER_SUBMISSION)))
+# Longest time a request waits in the client-side Groq rate limiter before using fallbacks
+AI_RATE_LIMIT_MAX_WAIT = float(os.getenv("AI_RATE_LIMIT_MAX_WAIT", "30"))
+# Ask for response, summary and actions in a single structured-output call
+AI_FUSED_MODE = os.getenv("AI_FUSED_MODE", "false").lower() == "true"
 
-client = Groq(api_key=GROQ_API_KEY) if GROQ_API_KEY else None
+# Initialize LLM backend (Groq, or the offline stub when LLM_BACKEND=stub)
+backend = create_backend(rate_limit_timeout=AI_RATE_LIMIT_MAX_WAIT)
 
 
 class AIService:
     """Service for AI-powered review analysis using Groq"""
     
-    def __init__(self):
+    def __init__(self, llm_backend=backend):
+        self.backend = llm_backend
         self.model = "llama-3.3-70b-versatile"
-        self.max_retries = 2
+        self.temperature = 0.1
+        self.retry_policy = RetryPolicy()
+        self.max_retries = self.retry_policy.max_retries
+        self.breaker = CircuitBreaker()
+        self.cache = llm_cache
+        self._counters = {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "short_circuited": 0,
+            "rate_limit_timeouts": 0,
+            "fallbacks": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
+        self._counters_lock = threading.Lock()
+        self.concurrent = AI_CONCURRENT_CALLS
+        self.fused = AI_FUSED_MODE
+        # Shared bounded pool so a burst of submissions cannot open unlimited Groq connections;
+        # threads are only started when calls are actually in flight
+        self._executor = ThreadPoolExecutor(max_workers=AI_MAX_WORKERS, thread_name_prefix="ai-call")
+    
+    def _call_llm(self, prompt: str, use_cache: bool = True) -> Optional[str]:
+        """Call Groq API, serving identical prompts from the response cache"""
+        with metrics.timed("llm_call"):
+            cache_key, cached = self._cache_lookup(prompt, use_cache)
+            if cached is not None:
+                return cached
+            
+            response = self._request_completion(prompt)
+            self._cache_store(cache_key, response)
+            return response
+    
+    async def _acall_llm(self, prompt: str, use_cache: bool = True) -> Optional[str]:
+        """Async variant of _call_llm for the async API"""
+        with metrics.timed("llm_call"):
+            cache_key, cached = await self._acache_lookup(prompt, use_cache)
+            if cached is not None:
+                return cached
+            
+            response = await self._arequest_completion(prompt)
+            await self._acache_store(cache_key, response)
+            return response
+    
+    def _call_fused(self, prompt: str) -> Tuple[Optional[str], Optional[ReviewInsights]]:
+        """_call_llm for the fused prompt; the response is only cached once it validates"""
+        with metrics.timed("llm_call"):
+            cache_key, cached = self._cache_lookup(prompt, True)
+            if cached is not None:
+                return cached, self._parse_review_insights(cached)
+            
+            response = self._request_completion(prompt)
+            insights = self._parse_review_insights(response) if response else None
+            if insights:
+                self._cache_store(cache_key, response)
+            return response, insights
     
-    def _call_llm(self, prompt: str, retry_count: int = 0) -> Optional[str]:
-        """Call Groq API with retry logic"""
-        if not client:
-            logger.error("Groq client not initialized")
+    async def _acall_fused(self, prompt: str) -> Tuple[Optional[str], Optional[ReviewInsights]]:
+        """Async variant of _call_fused"""
+        with metrics.timed("llm_call"):
+            cache_key, cached = await self._acache_lookup(prompt, True)
+            if cached is not None:
+                return cached, self._parse_review_insights(cached)
+            
+            response = await self._arequest_completion(prompt)
+            insights = self._parse_review_insights(response) if response else None
+            if insights:
+                await self._acache_store(cache_key, response)
+            return response, insights
+    
+    def _cache_lookup(self, prompt: str, use_cache: bool) -> Tuple[Optional[str], Optional[str]]:
+        """Returns (cache key, cached response)"""
+        if not use_cache or self.cache is None:
+            return None, None
+        cache_key = make_cache_key(self.model, self.temperature, prompt)
+        return cache_key, self.cache.get(cache_key)
+    
+    def _cache_store(self, cache_key: Optional[str], response: Optional[str]):
+        # Only successful responses are cached so fallbacks never stick
+        if response and cache_key:
+            self.cache.set(cache_key, response)
+    
+    async def _acache_lookup(self, prompt: str, use_cache: bool) -> Tuple[Optional[str], Optional[str]]:
+        """_cache_lookup for the event loop; the SQLite tier is read in a worker thread"""
+        if use_cache and self.cache is not None and self.cache.persistent:
+            return await asyncio.to_thread(self._cache_lookup, prompt, use_cache)
+        return self._cache_lookup(prompt, use_cache)
+    
+    async def _acache_store(self, cache_key: Optional[str], response: Optional[str]):
+        if response and cache_key and self.cache.persistent:
+            await asyncio.to_thread(self._cache_store, cache_key, response)
+        else:
+            self._cache_store(cache_key, response)
+    
+    def _request_completion(self, prompt: str) -> Optional[str]:
+        """Call the LLM backend with exponential backoff and a circuit breaker"""
+        token = self._admit_request()
+        if token is None:
             return None
+        
+        try:
+            slept = 0.0
+            for attempt in range(self.max_retries + 1):
+                self._count("calls")
+                try:
+                    result = self.backend.complete(prompt, self.model, self.temperature)
+                    self.breaker.record_success()
+                    self._record_usage(result)
+                    return result.text
+                except RateLimitTimeout as e:
+                    self._record_rate_limit_timeout(e)
+                    return None
+                except Exception as e:
+                    delay = self._next_retry_delay(e, attempt, slept)
+                    if delay is None:
+                        return None
+                    time.sleep(delay)
+                    slept += delay
             
+            return None
+        finally:
+            # A half-open trial that ended without a success or failure (rate-limit timeout,
+            # cancellation) must not block every later call
+            self.breaker.release_trial(token)
+    
+    async def _arequest_completion(self, prompt: str) -> Optional[str]:
+        """Async variant of _request_completion; backoff waits on the event loop"""
+        token = self._admit_request()
+        if token is None:
+            return None
+        
         try:
-            chat_completion = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-                temperature=0.1,
-            )
-            return chat_completion.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Groq call failed (attempt {retry_count + 1}): {str(e)}")
-            if retry_count < self.max_retries:
-                time.sleep(1)
-                return self._call_llm(prompt, retry_count + 1)
+            slept = 0.0
+            for attempt in range(self.max_retries + 1):
+                self._count("calls")
+                try:
+                    result = await self.backend.acomplete(prompt, self.model, self.temperature)
+                    self.breaker.record_success()
+                    self._record_usage(result)
+                    return result.text
+                except RateLimitTimeout as e:
+                    self._record_rate_limit_timeout(e)
+                    return None
+                except Exception as e:
+                    delay = self._next_retry_delay(e, attempt, slept)
+                    if delay is None:
+                        return None
+                    await asyncio.sleep(delay)
+                    slept += delay
+            
             return None
+        finally:
+            # A half-open trial that ended without a success or failure (rate-limit timeout,
+            # cancellation) must not block every later call
+            self.breaker.release_trial(token)
     
-    def generate_user_response(self, name: str, rating: int, review_text: str) -> str:
-        """Generate a personalized response for the user"""
-        prompt = f"""You are a customer service representative. A customer named {name} has left a {rating}-star review.
+    def _admit_request(self) -> Optional[object]:
+        """Circuit breaker token for one LLM call (with its retries), or None to use the fallback"""
+        if not self.backend:
+            logger.error("LLM backend not initialized")
+            return None
+        
+        # Groq has been failing: go straight to the fallback responses
+        token = self.breaker.allow_request()
+        if token is None:
+            self._count("short_circuited")
+        return token
+    
+    def _record_rate_limit_timeout(self, error: RateLimitTimeout):
+        # Our own quota is exhausted; Groq itself is healthy
+        self._count("rate_limit_timeouts")
+        logger.warning(str(error))
+    
+    def _next_retry_delay(self, error: Exception, attempt: int, slept: float) -> Optional[float]:
+        """Record a failed attempt; seconds to wait before the next one, or None to give up"""
+        self._count("failures")
+        logger.error(f"LLM call failed (attempt {attempt + 1}): {str(error)}")
+        
+        if not self._is_retryable(error):
+            # Groq answered; the request itself is bad, so retrying will not help
+            self.breaker.record_success()
+            return None
+        
+        self.breaker.record_failure()
+        if attempt == self.max_retries or self.breaker.is_open():
+            return None
+        
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            self._count("rate_limited")
+        delay = self.retry_policy.compute_delay(attempt, retry_after)
+        if slept + delay > self.retry_policy.budget_seconds:
+            logger.warning(f"Retry budget exhausted (next delay {delay:.1f}s)")
+            return None
+        
+        self._count("retries")
+        return delay
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """Rate limits, server errors and network failures are retried; other 4xx are not"""
+        # Groq SDK status errors (and simulated stub errors) carry the HTTP status code
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None:
+            return status_code == 429 or status_code >= 500
+        return True
+    
+    def _count(self, name: str):
+        with self._counters_lock:
+            self._counters[name] += 1
+    
+    def _record_usage(self, result):
+        """Add the token usage of one completion to the counters"""
+        with self._counters_lock:
+            self._counters["prompt_tokens"] += result.prompt_tokens
+            self._counters["completion_tokens"] += result.completion_tokens
+    
+    def _parse_json_response(self, response_text: str) -> Optional[dict]:
+        """Parse a JSON object from an LLM response, tolerating markdown code fences"""
+        # Clean up markdown code blocks
+        if "```json" in response_text:
+            response_text = response_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in response_text:
+            response_text = response_text.split("```")[1].split("```")[0].strip()
+        
+        try:
+            result = json.loads(response_text)
+        except json.JSONDecodeError:
+            # Models sometimes wrap the object in prose; retry on the outermost braces
+            start, end = response_text.find("{"), response_text.rfind("}")
+            if start == -1 or end <= start:
+                return None
+            try:
+                result = json.loads(response_text[start:end + 1])
+            except json.JSONDecodeError:
+                return None
+        
+        return result if isinstance(result, dict) else None
+    
+    def _review_insights_prompt(self, name: str, rating: int, review_text: str) -> str:
+        """Build the fused prompt that asks for response, summary and actions as one JSON object"""
+        return f"""You are a customer service analyst. A customer named {name} has left a {rating}-star review.
+
+Review: "{review_text}"
+
+Produce:
+1. "user_response": a warm, professional, personalized response (2-3 sentences) that addresses {name} by name, thanks them, addresses their specific points and is appropriate for a {rating}-star rating
+2. "summary": a one-sentence summary of the review (max 15 words)
+3. "recommended_actions": 2-3 specific, actionable next steps for the business
+4. "severity": how urgently the business must act, from 1 (minor) to 5 (critical: health, safety, legal or financial harm)
+
+Return ONLY a JSON object in this exact format:
+{{"user_response": "<response>", "summary": "<summary>", "recommended_actions": ["<action>", "<action>"], "severity": <1-5>}}"""
+    
+    def _parse_review_insights(self, response: str) -> Optional[ReviewInsights]:
+        """Validate the fused LLM output; None if it is malformed"""
+        result = self._parse_json_response(response)
+        if result is None:
+            logger.warning("Fused LLM output was not valid JSON")
+            return None
+        
+        try:
+            return ReviewInsights.model_validate(result)
+        except ValidationError as e:
+            logger.warning(f"Fused LLM output failed validation: {str(e)}")
+            return None
+    
+    def _user_response_prompt(self, name: str, rating: int, review_text: str) -> str:
+        return f"""You are a customer service representative. A customer named {name} has left a {rating}-star review.
 
 Review: "{review_text}"
 
@@ -62,61 +325,70 @@ Generate a warm, professional, and personalized response (2-3 sentences) that:
 4. Is appropriate for a {rating}-star rating
 
 Response:"""
-        
-        response = self._call_llm(prompt)
+    
+    def generate_user_response(self, name: str, rating: int, review_text: str) -> str:
+        """Generate a personalized response for the user"""
+        response = self._call_llm(self._user_response_prompt(name, rating, review_text))
         
         # Fallback responses if LLM fails
         if not response:
-            fallback_responses = {
-                5: "Thank you so much for your wonderful 5-star review! We're thrilled to hear about your positive experience.",
-                4: "Thank you for your 4-star review! We appreciate your feedback and are glad you had a good experience.",
-                3: "Thank you for your review. We appreciate your feedback and will work to improve your experience.",
-                2: "Thank you for sharing your feedback. We're sorry your experience wasn't better and will work to address your concerns.",
-                1: "We sincerely apologize for your experience. Your feedback is important to us and we will take immediate action to improve."
-            }
-            return fallback_responses.get(rating, "Thank you for your feedback!")
+            return self._fallback_user_response(rating)
         
         return response
     
-    def generate_summary(self, review_text: str) -> str:
-        """Generate a concise summary of the review"""
-        prompt = f"""Summarize this customer review in one concise sentence (max 15 words):
+    def _fallback_user_response(self, rating: int) -> str:
+        """Rating-based user response used when the LLM is unavailable"""
+        self._count("fallbacks")
+        fallback_responses = {
+            5: "Thank you so much for your wonderful 5-star review! We're thrilled to hear about your positive experience.",
+            4: "Thank you for your 4-star review! We appreciate your feedback and are glad you had a good experience.",
+            3: "Thank you for your review. We appreciate your feedback and will work to improve your experience.",
+            2: "Thank you for sharing your feedback. We're sorry your experience wasn't better and will work to address your concerns.",
+            1: "We sincerely apologize for your experience. Your feedback is important to us and we will take immediate action to improve."
+        }
+        return fallback_responses.get(rating, "Thank you for your feedback!")
+    
+    def _summary_prompt(self, review_text: str) -> str:
+        return f"""Summarize this customer review in one concise sentence (max 15 words):
 
 Review: "{review_text}"
 
 Summary:"""
-        
-        response = self._call_llm(prompt)
+    
+    def generate_summary(self, review_text: str) -> str:
+        """Generate a concise summary of the review"""
+        response = self._call_llm(self._summary_prompt(review_text))
         
         # Fallback if LLM fails
         if not response:
-            # Simple truncation fallback
-            return review_text[:100] + "..." if len(review_text) > 100 else review_text
+            return self._fallback_summary(review_text)
         
         return response
     
-    def generate_recommended_actions(self, rating: int, review_text: str) -> List[str]:
-        """Generate recommended actions for admin"""
-        prompt = f"""Based on this {rating}-star review, suggest 2-3 specific, actionable next steps for the business.
+    def _fallback_summary(self, review_text: str) -> str:
+        """Simple truncation fallback for the summary"""
+        self._count("fallbacks")
+        return review_text[:100] + "..." if len(review_text) > 100 else review_text
+    
+    def _actions_prompt(self, rating: int, review_text: str) -> str:
+        return f"""Based on this {rating}-star review, suggest 2-3 specific, actionable next steps for the business.
 
 Review: "{review_text}"
 
 Provide ONLY the action items as a numbered list:"""
-        
-        response = self._call_llm(prompt)
+    
+    def generate_recommended_actions(self, rating: int, review_text: str) -> List[str]:
+        """Generate recommended actions for admin"""
+        response = self._call_llm(self._actions_prompt(rating, review_text))
         
         # Fallback actions if LLM fails
         if not response:
-            fallback_actions = {
-                5: ["Send thank you message", "Request testimonial", "Offer loyalty reward"],
-                4: ["Follow up on feedback", "Identify improvement areas"],
-                3: ["Investigate concerns", "Follow up with customer", "Review service quality"],
-                2: ["Contact customer immediately", "Investigate issues", "Offer compensation"],
-                1: ["Urgent: Contact customer", "Escalate to management", "Conduct internal review"]
-            }
-            return fallback_actions.get(rating, ["Review feedback", "Take appropriate action"])
-        
-        # Parse numbered list
+            return self._fallback_actions(rating)
+        
+        return self._parse_actions(response)
+    
+    def _parse_actions(self, response: str) -> List[str]:
+        """Parse a numbered or bulleted list of actions"""
         actions = []
         for line in response.split('\n'):
             line = line.strip()
@@ -130,21 +402,203 @@ Provide ONLY the action items as a numbered list:"""
         
         return actions[:3] if actions else ["Review feedback", "Take appropriate action"]
     
+    def _fallback_actions(self, rating: int) -> List[str]:
+        """Rating-based recommended actions used when the LLM is unavailable"""
+        self._count("fallbacks")
+        fallback_actions = {
+            5: ["Send thank you message", "Request testimonial", "Offer loyalty reward"],
+            4: ["Follow up on feedback", "Identify improvement areas"],
+            3: ["Investigate concerns", "Follow up with customer", "Review service quality"],
+            2: ["Contact customer immediately", "Investigate issues", "Offer compensation"],
+            1: ["Urgent: Contact customer", "Escalate to management", "Conduct internal review"]
+        }
+        return fallback_actions.get(rating, ["Review feedback", "Take appropriate action"])
+    
+    def _severity_prompt(self, rating: int, review_text: str) -> str:
+        return f"""Rate how urgently the business must act on this {rating}-star review, from 1 (minor) to 5 (critical: health, safety, legal or financial harm).
+
+Review: "{review_text}"
+
+Reply with ONLY the number:"""
+    
+    def _parse_severity(self, response: Optional[str]) -> Optional[int]:
+        match = re.search(r"[1-5]", response or "")
+        return int(match.group()) if match else None
+    
+    def assess_severity(self, rating: int, review_text: str) -> Optional[int]:
+        """LLM severity (1-5) for the priority score; None for positive reviews or when the LLM is unavailable"""
+        # 4-5 star reviews are never urgent enough to be worth a call
+        if rating >= 4:
+            return None
+        return self._parse_severity(self._call_llm(self._severity_prompt(rating, review_text)))
+    
+    async def aassess_severity(self, rating: int, review_text: str) -> Optional[int]:
+        """Async variant of assess_severity"""
+        if rating >= 4:
+            return None
+        return self._parse_severity(await self._acall_llm(self._severity_prompt(rating, review_text)))
+    
+    def analyze_review(self, name: str, rating: int, review_text: str) -> Tuple[str, str, List[str], Optional[int]]:
+        """
+        process_review plus the severity used by the priority queue
+        Returns: (user_response, summary, recommended_actions, severity)
+        """
+        if self.fused:
+            # The fused JSON carries the severity, so no extra call
+            outputs, severity = self._process_review(name, rating, review_text)
+            return (*outputs, severity)
+        
+        if not self.concurrent:
+            outputs, _ = self._process_review(name, rating, review_text)
+            return (*outputs, self.assess_severity(rating, review_text))
+        
+        severity_future = self._executor.submit(self.assess_severity, rating, review_text)
+        outputs, _ = self._process_review(name, rating, review_text)
+        try:
+            severity = severity_future.result()
+        except Exception as e:
+            logger.error(f"Severity assessment failed: {str(e)}")
+            severity = None
+        return (*outputs, severity)
+    
+    async def aanalyze_review(self, name: str, rating: int, review_text: str) -> Tuple[str, str, List[str], Optional[int]]:
+        """Async variant of analyze_review"""
+        if self.fused:
+            outputs, severity = await self._aprocess_review(name, rating, review_text)
+            return (*outputs, severity)
+        
+        (outputs, _), severity = await asyncio.gather(
+            self._aprocess_review(name, rating, review_text),
+            self.aassess_severity(rating, review_text)
+        )
+        return (*outputs, severity)
+    
     def process_review(self, name: str, rating: int, review_text: str) -> Tuple[str, str, List[str]]:
         """
         Process a review and generate all AI outputs
         Returns: (user_response, summary, recommended_actions)
         """
+        return self._process_review(name, rating, review_text)[0]
+    
+    def _process_review(self, name: str, rating: int, review_text: str) -> Tuple[Tuple[str, str, List[str]], Optional[int]]:
+        """AI outputs plus the severity from the fused JSON (None outside fused mode)"""
         logger.info(f"Processing review from {name} with rating {rating}")
         
-        # Generate all three AI outputs
-        user_response = self.generate_user_response(name, rating, review_text)
-        summary = self.generate_summary(review_text)
-        recommended_actions = self.generate_recommended_actions(rating, review_text)
+        if self.fused:
+            response, insights = self._call_fused(self._review_insights_prompt(name, rating, review_text))
+            if not response:
+                # The LLM is unavailable, so per-field prompts would fail as well
+                logger.info("Review processing completed (fallback)")
+                return self._fallback_outputs(rating, review_text), None
+            
+            if insights:
+                logger.info("Review processing completed (fused)")
+                return (insights.user_response, insights.summary, insights.recommended_actions), insights.severity
+            logger.info("Fused output malformed, falling back to per-field prompts")
+        
+        if self.concurrent:
+            user_response, summary, recommended_actions = self._process_concurrently(name, rating, review_text)
+        else:
+            # Generate all three AI outputs
+            user_response = self.generate_user_response(name, rating, review_text)
+            summary = self.generate_summary(review_text)
+            recommended_actions = self.generate_recommended_actions(rating, review_text)
         
         logger.info("Review processing completed")
         
+        return (user_response, summary, recommended_actions), None
+    
+    def _process_concurrently(self, name: str, rating: int, review_text: str) -> Tuple[str, str, List[str]]:
+        """Send all three LLM calls at once; latency is the slowest call instead of the sum"""
+        response_future = self._executor.submit(self.generate_user_response, name, rating, review_text)
+        summary_future = self._executor.submit(self.generate_summary, review_text)
+        actions_future = self._executor.submit(self.generate_recommended_actions, rating, review_text)
+        
+        # Each output falls back on its own so one failed call does not discard the others
+        try:
+            user_response = response_future.result()
+        except Exception as e:
+            logger.error(f"User response generation failed: {str(e)}")
+            user_response = self._fallback_user_response(rating)
+        
+        try:
+            summary = summary_future.result()
+        except Exception as e:
+            logger.error(f"Summary generation failed: {str(e)}")
+            summary = self._fallback_summary(review_text)
+        
+        try:
+            recommended_actions = actions_future.result()
+        except Exception as e:
+            logger.error(f"Recommended actions generation failed: {str(e)}")
+            recommended_actions = self._fallback_actions(rating)
+        
         return user_response, summary, recommended_actions
+    
+    async def aprocess_review(self, name: str, rating: int, review_text: str) -> Tuple[str, str, List[str]]:
+        """
+        Async variant of process_review used by the async API
+        Returns: (user_response, summary, recommended_actions)
+        """
+        return (await self._aprocess_review(name, rating, review_text))[0]
+    
+    async def _aprocess_review(self, name: str, rating: int, review_text: str) -> Tuple[Tuple[str, str, List[str]], Optional[int]]:
+        logger.info(f"Processing review from {name} with rating {rating}")
+        
+        if self.fused:
+            response, insights = await self._acall_fused(self._review_insights_prompt(name, rating, review_text))
+            if not response:
+                logger.info("Review processing completed (fallback)")
+                return self._fallback_outputs(rating, review_text), None
+            
+            if insights:
+                logger.info("Review processing completed (fused)")
+                return (insights.user_response, insights.summary, insights.recommended_actions), insights.severity
+            logger.info("Fused output malformed, falling back to per-field prompts")
+        
+        # Waiting on the event loop costs no threads, so the three calls always overlap
+        responses = await asyncio.gather(
+            self._acall_llm(self._user_response_prompt(name, rating, review_text)),
+            self._acall_llm(self._summary_prompt(review_text)),
+            self._acall_llm(self._actions_prompt(rating, review_text)),
+            return_exceptions=True
+        )
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"Review output generation failed: {str(response)}")
+        user_response, summary, actions = [
+            response if isinstance(response, str) and response else None for response in responses
+        ]
+        
+        logger.info("Review processing completed")
+        
+        return (
+            user_response or self._fallback_user_response(rating),
+            summary or self._fallback_summary(review_text),
+            self._parse_actions(actions) if actions else self._fallback_actions(rating)
+        ), None
+    
+    def _fallback_outputs(self, rating: int, review_text: str) -> Tuple[str, str, List[str]]:
+        """All three static fallbacks, for when the LLM is unavailable"""
+        return (
+            self._fallback_user_response(rating),
+            self._fallback_summary(review_text),
+            self._fallback_actions(rating)
+        )
+    
+    def get_stats(self) -> dict:
+        """Operational counters for the AI layer"""
+        with self._counters_lock:
+            counters = dict(self._counters)
+        rate_limiter = getattr(self.backend, "rate_limiter", None)
+        return {
+            "model": self.model,
+            "backend": self.backend.name if self.backend else None,
+            "llm_calls": counters,
+            "circuit_breaker": self.breaker.stats(),
+            "rate_limiter": rate_limiter.stats() if rate_limiter else {"enabled": False},
+            "cache": self.cache.stats() if self.cache is not None else {"enabled": False}
+        }
 
 
 # Singleton instance
@@ -0,0 +1,238 @@
+"""
+Async versions of the hot review endpoints (ASYNC_API=true)
+Submissions wait on the LLM and the database without holding a worker thread,
+so one process can keep hundreds of slow submissions in flight.
+"""
+
+import uuid
+import logging
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import (
+    ReviewSubmitRequest,
+    ReviewSubmitResponse,
+    AdminReviewItem,
+    ReviewStatusResponse,
+    ErrorResponse
+)
+from database import (
+    get_async_db,
+    get_async_read_db,
+    async_engine,
+    async_read_engine,
+    AsyncSessionLocal,
+    Review,
+    STATUS_PENDING,
+    STATUS_COMPLETED,
+    DATABASE_READ_URL,
+    READ_YOUR_WRITES_FALLBACK
+)
+from ai_service import ai_service
+from enrichment import enrichment_queue, ASYNC_ENRICHMENT
+import rollups
+import priority
+import events
+import http_cache
+import metrics
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+async def _save_review(db: AsyncSession, db_review: Review):
+    """Insert the review and update the analytics rollups in one transaction"""
+    db.add(db_review)
+    await db.run_sync(lambda session: rollups.record_review(session, db_review.rating, db_review.created_at))
+    with metrics.timed("db_commit"):
+        await db.commit()
+
+
+# Submit review endpoint (User-facing)
+@router.post("/api/reviews", response_model=ReviewSubmitResponse, responses={202: {"model": ReviewSubmitResponse}, 422: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+async def submit_review(
+    review_request: ReviewSubmitRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Submit a new review (User-facing endpoint)
+
+    - **rating**: Star rating from 1 to 5
+    - **review_text**: Review text (10-5000 characters)
+
+    Returns AI-generated response for the user. When async enrichment is enabled,
+    returns 202 with status "pending"; poll /api/reviews/{id}/status for the response.
+    """
+    try:
+        logger.info(f"Received review submission: rating={review_request.rating}")
+
+        if ASYNC_ENRICHMENT:
+            return await _accept_review(review_request, response, db)
+
+        # Generate AI responses (server-side)
+        with metrics.timed("analyze"):
+            user_response, summary, recommended_actions, severity = await ai_service.aanalyze_review(
+                review_request.name,
+                review_request.rating,
+                review_request.review_text
+            )
+
+        # Create review record
+        review_id = str(uuid.uuid4())
+        created_at = datetime.utcnow()
+        db_review = Review(
+            id=review_id,
+            customer_name=review_request.name,
+            rating=review_request.rating,
+            review_text=review_request.review_text,
+            summary=summary,
+            recommended_actions=recommended_actions,
+            user_response=user_response,
+            status=STATUS_COMPLETED,
+            created_at=created_at,
+            **priority.score_fields(review_request.rating, review_request.review_text, created_at, severity)
+        )
+
+        # expire_on_commit=False keeps the attributes loaded, so no refresh round-trip
+        await _save_review(db, db_review)
+        events.publish_review_created(db_review)
+
+        logger.info(f"Review saved successfully: id={review_id}")
+
+        # Return response to user
+        return ReviewSubmitResponse(
+            id=db_review.id,
+            rating=db_review.rating,
+            review_text=db_review.review_text,
+            user_response=db_review.user_response,
+            created_at=db_review.created_at,
+            status="success"
+        )
+
+    except Exception as e:
+        logger.error(f"Error submitting review: {str(e)}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to submit review: {str(e)}")
+
+
+async def _accept_review(review_request: ReviewSubmitRequest, response: Response, db: AsyncSession) -> ReviewSubmitResponse:
+    """Store the review without AI fields and hand it to the background enrichment queue"""
+    review_id = str(uuid.uuid4())
+    created_at = datetime.utcnow()
+    db_review = Review(
+        id=review_id,
+        customer_name=review_request.name,
+        rating=review_request.rating,
+        review_text=review_request.review_text,
+        status=STATUS_PENDING,
+        created_at=created_at,
+        **priority.score_fields(review_request.rating, review_request.review_text, created_at)
+    )
+
+    await _save_review(db, db_review)
+    events.publish_review_created(db_review)
+
+    enrichment_queue.enqueue(review_id)
+    logger.info(f"Review accepted for enrichment: id={review_id}")
+
+    response.status_code = 202
+    return ReviewSubmitResponse(
+        id=db_review.id,
+        rating=db_review.rating,
+        review_text=db_review.review_text,
+        user_response=None,
+        created_at=db_review.created_at,
+        status=STATUS_PENDING
+    )
+
+
+# Get single review endpoint
+@router.get("/api/reviews/{review_id}", response_model=AdminReviewItem)
+async def get_review(review_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get a single review by ID
+
+    - **review_id**: UUID of the review
+
+    Supports If-None-Match / If-Modified-Since (304 when nothing has changed)
+    """
+    version, last_modified = await db.run_sync(rollups.read_version)
+    etag = http_cache.make_etag("review", version)
+    if http_cache.is_not_modified(request, etag, last_modified):
+        return http_cache.not_modified(etag, last_modified)
+    http_cache.set_cache_headers(response, etag, last_modified)
+
+    review = await db.scalar(select(Review).where(Review.id == review_id))
+
+    # A review submitted moments ago may not have reached the replica yet
+    if not review and DATABASE_READ_URL and READ_YOUR_WRITES_FALLBACK:
+        async with AsyncSessionLocal() as primary:
+            review = await primary.scalar(select(Review).where(Review.id == review_id))
+
+    if not review:
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    return AdminReviewItem(
+        id=review.id,
+        rating=review.rating,
+        review_text=review.review_text,
+        summary=review.summary,
+        recommended_actions=review.recommended_actions,
+        user_response=review.user_response,
+        status=review.status,
+        created_at=review.created_at
+    )
+
+
+# Enrichment status endpoint (User-facing)
+@router.get("/api/reviews/{review_id}/status", response_model=ReviewStatusResponse)
+async def get_review_status(review_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Get the enrichment status of a submitted review
+
+    - **review_id**: UUID of the review
+
+    Returns the AI-generated user response once status is "completed"
+    """
+    row = (await db.execute(
+        select(Review.id, Review.status, Review.user_response).where(Review.id == review_id)
+    )).first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    return ReviewStatusResponse(
+        id=row.id,
+        status=row.status,
+        user_response=row.user_response
+    )
+
+
+def install(app):
+    """
+    Remove the sync handlers for the routes above and append the async ones
+    
+    The async routes end up after every sync route, so call this once all sync routes
+    are registered: the fixed /api/reviews/* paths then still match before /{review_id}.
+    """
+    replaced = {(route.path, method) for route in router.routes for method in route.methods}
+    app.router.routes = [
+        route for route in app.router.routes
+        if not any((getattr(route, "path", None), method) in replaced for method in getattr(route, "methods", None) or ())
+    ]
+    app.include_router(router)
+    app.add_event_handler("shutdown", dispose_engine)
+
+
+async def dispose_engine():
+    """Close pooled async connections (aiosqlite keeps a thread per connection)"""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
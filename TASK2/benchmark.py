@@ -0,0 +1,495 @@
+"""
+Offline benchmarks for the review API and the TASK1 evaluation harness
+Runs against the stub LLM backend so results are reproducible without network access or quota
+
+Usage:
+    python benchmark.py submit [--requests 200] [--concurrency 20] [--latency-ms 300]
+    python benchmark.py eval [--rows 200] [--workers 8] [--latency-ms 300]
+    python benchmark.py analytics [--rows 1000000] [--database-url postgresql://...]
+    python benchmark.py db [--writers 4] [--readers 8] [--duration 10]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import statistics
+import logging
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+TASK2_DIR = os.path.dirname(os.path.abspath(__file__))
+TASK1_DIR = os.path.join(TASK2_DIR, "..", "TASK1")
+
+WORDS = (
+    "food service staff order delivery price quality table wait friendly rude cold fresh "
+    "delicious slow fast clean dirty manager refund portion menu drinks dessert great terrible"
+).split()
+
+
+def configure_stub_env(args, database_url: str):
+    """Environment read by the service modules at import time"""
+    os.environ["LLM_BACKEND"] = "stub"
+    os.environ["LLM_STUB_LATENCY_MS"] = str(getattr(args, "latency_ms", 0))
+    os.environ["LLM_STUB_LATENCY_DIST"] = getattr(args, "latency_dist", "fixed")
+    os.environ["LLM_STUB_ERROR_RATE"] = str(getattr(args, "error_rate", 0))
+    os.environ["LLM_STUB_SEED"] = str(args.seed)
+    os.environ["DATABASE_URL"] = database_url
+
+
+def make_review_text(rng: random.Random) -> str:
+    """Unique synthetic review so the LLM response cache does not short-circuit the benchmark"""
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 60))) + f" #{rng.randint(0, 10**9)}"
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, latencies, errors: int, elapsed: float) -> dict:
+    return {
+        "benchmark": name,
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies) * 1000, 1) if latencies else None,
+            "p50": round(percentile(latencies, 50) * 1000, 1) if latencies else None,
+            "p95": round(percentile(latencies, 95) * 1000, 1) if latencies else None,
+            "p99": round(percentile(latencies, 99) * 1000, 1) if latencies else None,
+        }
+    }
+
+
+def print_report(report: dict, as_json: bool):
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+    print("\n" + "=" * 60)
+    print(f"Benchmark: {report['benchmark']}")
+    print("=" * 60)
+    for key, value in report.items():
+        if key == "benchmark":
+            continue
+        if isinstance(value, dict):
+            print(f"  {key}:")
+            for sub_key, sub_value in value.items():
+                print(f"    {sub_key}: {sub_value}")
+        else:
+            print(f"  {key}: {value}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def bench_submit(args):
+    """Throughput and latency of POST /api/reviews through a real uvicorn server"""
+    import httpx
+    import uvicorn
+    
+    workdir = tempfile.mkdtemp(prefix="review-bench-")
+    configure_stub_env(args, f"sqlite:///{os.path.join(workdir, 'bench.db')}")
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["ASYNC_API"] = "true" if args.async_api else "false"
+    sys.path.insert(0, TASK2_DIR)
+    import main
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    server_thread = threading.Thread(target=server.run, daemon=True)
+    server_thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    
+    rng = random.Random(args.seed)
+    payloads = [
+        {"name": f"Bench User {i}", "rating": rng.randint(1, 5), "review_text": make_review_text(rng)}
+        for i in range(args.requests)
+    ]
+    
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=120, limits=limits) as client:
+        def submit(payload):
+            nonlocal errors
+            start = time.perf_counter()
+            try:
+                response = client.post("/api/reviews", json=payload)
+                ok = response.status_code in (200, 202)
+            except httpx.HTTPError:
+                ok = False
+            duration = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(duration)
+                else:
+                    errors += 1
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            list(executor.map(submit, payloads))
+        elapsed = time.perf_counter() - start
+    
+    server.should_exit = True
+    server_thread.join(timeout=10)
+    
+    report = summarize("submit_review", latencies, errors, elapsed)
+    report["config"] = {
+        "concurrency": args.concurrency,
+        "async_api": args.async_api,
+        "stub_latency_ms": args.latency_ms,
+        "stub_latency_dist": args.latency_dist,
+        "stub_error_rate": args.error_rate
+    }
+    print_report(report, args.json)
+
+
+def bench_eval(args):
+    """Wall time of TASK1/evaluate_with_groq.py on a synthetic Yelp sample"""
+    workdir = tempfile.mkdtemp(prefix="eval-bench-")
+    rng = random.Random(args.seed)
+    
+    # Synthetic yelp.csv with the columns the evaluation script reads
+    with open(os.path.join(workdir, "yelp.csv"), "w", encoding="utf-8") as f:
+        f.write("review_id,stars,text\n")
+        for i in range(args.rows):
+            f.write(f"r{i},{rng.randint(1, 5)},\"{make_review_text(rng)}\"\n")
+    
+    env = dict(os.environ)
+    env.update({
+        "LLM_BACKEND": "stub",
+        "LLM_STUB_LATENCY_MS": str(args.latency_ms),
+        "LLM_STUB_LATENCY_DIST": args.latency_dist,
+        "LLM_STUB_ERROR_RATE": str(args.error_rate),
+        "LLM_STUB_SEED": str(args.seed),
+    })
+    script = os.path.abspath(os.path.join(TASK1_DIR, "evaluate_with_groq.py"))
+    
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, script, "--sample-size", str(args.rows), "--workers", str(args.workers),
+         "--checkpoint", os.path.join(workdir, "checkpoint.jsonl")],
+        cwd=workdir, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    
+    if completed.returncode != 0:
+        print(completed.stdout)
+        print(completed.stderr, file=sys.stderr)
+        sys.exit(f"Evaluation script failed with exit code {completed.returncode}")
+    
+    predictions = args.rows * 3  # three prompt variants
+    report = {
+        "benchmark": "evaluation_harness",
+        "predictions": predictions,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_pps": round(predictions / elapsed, 2),
+        "config": {
+            "workers": args.workers,
+            "stub_latency_ms": args.latency_ms,
+            "stub_latency_dist": args.latency_dist,
+            "stub_error_rate": args.error_rate
+        }
+    }
+    print_report(report, args.json)
+
+
+def seed_reviews(database, rows: int, rng: random.Random, batch_size: int = 10000) -> int:
+    """Top the reviews table up to `rows` synthetic reviews spread over the last 90 days"""
+    from sqlalchemy import insert
+    import priority
+    
+    db = database.SessionLocal()
+    try:
+        existing = db.query(database.Review).count()
+        now = datetime.utcnow()
+        for start in range(existing, rows, batch_size):
+            batch = []
+            for i in range(start, min(start + batch_size, rows)):
+                rating = rng.randint(1, 5)
+                review_text = make_review_text(rng)
+                created_at = now - timedelta(seconds=rng.randint(0, 90 * 24 * 3600))
+                batch.append({
+                    "id": f"bench-{i:08d}",
+                    "customer_name": "Bench User",
+                    "rating": rating,
+                    "review_text": review_text,
+                    "summary": "Synthetic benchmark review",
+                    "recommended_actions": ["Review feedback"],
+                    "user_response": "Thank you for your feedback!",
+                    "status": database.STATUS_COMPLETED,
+                    "created_at": created_at,
+                    "updated_at": now,
+                    **priority.score_fields(rating, review_text, created_at)
+                })
+            db.execute(insert(database.Review), batch)
+            db.commit()
+            print(f"Seeded {min(start + batch_size, rows)}/{rows} reviews...", file=sys.stderr)
+        return max(rows - existing, 0)
+    finally:
+        db.close()
+
+
+def legacy_analytics(db, Review):
+    """The original per-metric analytics queries, kept for comparison"""
+    from sqlalchemy import func
+    
+    total_reviews = db.query(Review).count()
+    avg_rating = db.query(func.avg(Review.rating)).scalar() or 0.0
+    rating_distribution = {}
+    for rating in range(1, 6):
+        rating_distribution[rating] = db.query(Review).filter(Review.rating == rating).count()
+    yesterday = datetime.utcnow() - timedelta(days=1)
+    recent_count = db.query(Review).filter(Review.created_at >= yesterday).count()
+    return {
+        "total_reviews": total_reviews,
+        "average_rating": round(float(avg_rating), 2),
+        "rating_distribution": rating_distribution,
+        "recent_reviews_count": recent_count
+    }
+
+
+def bench_analytics(args):
+    """Query count and latency of GET /api/analytics against the original per-metric queries"""
+    from sqlalchemy import event
+    
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='analytics-bench-'), 'bench.db')}"
+    configure_stub_env(args, database_url)
+    sys.path.insert(0, TASK2_DIR)
+    import database
+    import rollups
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    database.init_db()
+    seeded = seed_reviews(database, args.rows, random.Random(args.seed))
+    
+    # Seeding bypasses submit_review, so bring the analytics rollups up to date
+    db = database.SessionLocal()
+    try:
+        rollups.rebuild_rollups(db)
+    finally:
+        db.close()
+    
+    query_count = 0
+    
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        nonlocal query_count
+        query_count += 1
+    
+    event.listen(database.engine, "before_cursor_execute", count_query)
+    
+    variants = {
+        "legacy": lambda db: legacy_analytics(db, database.Review),
+        # The endpoint's work minus the response cache, which would turn every repeat into a hit
+        "current": lambda db: rollups.read_analytics(db)
+    }
+    
+    results = {}
+    outputs = {}
+    for name, fn in variants.items():
+        timings = []
+        for _ in range(args.repeats):
+            db = database.SessionLocal()
+            try:
+                query_count = 0
+                start = time.perf_counter()
+                outputs[name] = fn(db)
+                timings.append(time.perf_counter() - start)
+                queries = query_count
+            finally:
+                db.close()
+        results[name] = {
+            "queries": queries,
+            "median_ms": round(statistics.median(timings) * 1000, 2),
+            "min_ms": round(min(timings) * 1000, 2)
+        }
+    
+    report = {
+        "benchmark": "analytics",
+        "dialect": database.engine.dialect.name,
+        "rows": args.rows,
+        "seeded_rows": seeded,
+        "repeats": args.repeats,
+        "results_match": outputs["legacy"]["rating_distribution"] == outputs["current"]["rating_distribution"]
+            and outputs["legacy"]["total_reviews"] == outputs["current"]["total_reviews"],
+    }
+    report.update(results)
+    print_report(report, args.json)
+
+
+def add_stub_options(parser):
+    parser.add_argument("--latency-ms", type=float, default=300, help="Mean stub LLM latency")
+    parser.add_argument("--latency-dist", default="lognormal", choices=["fixed", "uniform", "lognormal"])
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub calls that fail")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+
+def bench_db(args):
+    """Concurrent read/write throughput on SQLite with and without the connection pragmas"""
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.exc import OperationalError
+    
+    workdir = tempfile.mkdtemp(prefix="db-bench-")
+    configure_stub_env(args, f"sqlite:///{os.path.join(workdir, 'import.db')}")
+    sys.path.insert(0, TASK2_DIR)
+    import database
+    import migrations
+    import rollups
+    from pagination import newest_first
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    def run_variant(name: str, sqlite_pragmas: bool) -> dict:
+        url = f"sqlite:///{os.path.join(workdir, name + '.db')}"
+        db_engine = database.create_db_engine(url, sqlite_pragmas=sqlite_pragmas)
+        migrations.run_migrations(db_engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+        
+        # Same starting data for both variants
+        original_session = database.SessionLocal
+        database.SessionLocal = Session
+        try:
+            seed_reviews(database, args.seed_rows, random.Random(args.seed))
+            db = Session()
+            try:
+                rollups.rebuild_rollups(db)
+            finally:
+                db.close()
+        finally:
+            database.SessionLocal = original_session
+        
+        stop_at = time.perf_counter() + args.duration
+        stats = {"write": [], "read": [], "errors": 0}
+        lock = threading.Lock()
+        
+        def write_loop(worker: int):
+            rng = random.Random(args.seed + worker)
+            while time.perf_counter() < stop_at:
+                db = Session()
+                start = time.perf_counter()
+                try:
+                    review = database.Review(
+                        id=f"w{worker}-{rng.getrandbits(64):x}",
+                        customer_name="Bench User",
+                        rating=rng.randint(1, 5),
+                        review_text=make_review_text(rng),
+                        status=database.STATUS_COMPLETED,
+                        created_at=datetime.utcnow()
+                    )
+                    db.add(review)
+                    rollups.record_review(db, review.rating, review.created_at)
+                    db.commit()
+                    with lock:
+                        stats["write"].append(time.perf_counter() - start)
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        stats["errors"] += 1
+                finally:
+                    db.close()
+        
+        def read_loop(worker: int):
+            while time.perf_counter() < stop_at:
+                db = Session()
+                start = time.perf_counter()
+                try:
+                    newest_first(db.query(database.Review)).limit(50).all()
+                    rollups.read_analytics(db)
+                    with lock:
+                        stats["read"].append(time.perf_counter() - start)
+                except OperationalError:
+                    with lock:
+                        stats["errors"] += 1
+                finally:
+                    db.close()
+        
+        threads = [threading.Thread(target=write_loop, args=(i,)) for i in range(args.writers)]
+        threads += [threading.Thread(target=read_loop, args=(i,)) for i in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        with db_engine.connect() as conn:
+            journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        db_engine.dispose()
+        
+        return {
+            "journal_mode": journal_mode,
+            "writes_per_s": round(len(stats["write"]) / args.duration, 1),
+            "write_p50_ms": round(percentile(stats["write"], 50) * 1000, 2) if stats["write"] else None,
+            "write_p95_ms": round(percentile(stats["write"], 95) * 1000, 2) if stats["write"] else None,
+            "reads_per_s": round(len(stats["read"]) / args.duration, 1),
+            "read_p50_ms": round(percentile(stats["read"], 50) * 1000, 2) if stats["read"] else None,
+            "read_p95_ms": round(percentile(stats["read"], 95) * 1000, 2) if stats["read"] else None,
+            "errors": stats["errors"]
+        }
+    
+    report = {
+        "benchmark": "db",
+        "writers": args.writers,
+        "readers": args.readers,
+        "duration_s": args.duration,
+        "seed_rows": args.seed_rows,
+        "default": run_variant("default", sqlite_pragmas=False),
+        "tuned": run_variant("tuned", sqlite_pragmas=True)
+    }
+    print_report(report, args.json)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks using the stub LLM backend")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    submit_parser = subparsers.add_parser("submit", help="Benchmark POST /api/reviews")
+    submit_parser.add_argument("--requests", type=int, default=200)
+    submit_parser.add_argument("--concurrency", type=int, default=20)
+    submit_parser.add_argument("--async-api", action="store_true", help="Serve submissions from the async endpoints")
+    add_stub_options(submit_parser)
+    submit_parser.set_defaults(func=bench_submit)
+    
+    eval_parser = subparsers.add_parser("eval", help="Benchmark the TASK1 evaluation harness")
+    eval_parser.add_argument("--rows", type=int, default=200)
+    eval_parser.add_argument("--workers", type=int, default=8)
+    add_stub_options(eval_parser)
+    eval_parser.set_defaults(func=bench_eval)
+    
+    analytics_parser = subparsers.add_parser("analytics", help="Benchmark GET /api/analytics queries")
+    analytics_parser.add_argument("--rows", type=int, default=1000000, help="Reviews to seed (tops up an existing table)")
+    analytics_parser.add_argument("--repeats", type=int, default=5)
+    analytics_parser.add_argument("--database-url", default="", help="Scratch database to use (default: temporary SQLite file)")
+    analytics_parser.add_argument("--seed", type=int, default=42)
+    analytics_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    analytics_parser.set_defaults(func=bench_analytics)
+    
+    db_parser = subparsers.add_parser("db", help="Benchmark concurrent SQLite reads/writes with and without pragmas")
+    db_parser.add_argument("--writers", type=int, default=4)
+    db_parser.add_argument("--readers", type=int, default=8)
+    db_parser.add_argument("--duration", type=float, default=10, help="Seconds per variant")
+    db_parser.add_argument("--seed-rows", type=int, default=20000, help="Reviews in the table before the run")
+    db_parser.add_argument("--seed", type=int, default=42)
+    db_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    db_parser.set_defaults(func=bench_db)
+    
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, JSON, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -10,18 +10,144 @@ load_dotenv()
 # Database URL - SQLite for development, PostgreSQL for production
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./reviews.db")
 
+# Connection pool settings (SQLite file databases use the same QueuePool)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Server-side databases only: drop stale connections before handing them out
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds; -1 disables
+
+# SQLite pragmas applied to every new connection
+SQLITE_PRAGMAS_ENABLED = os.getenv("SQLITE_PRAGMAS_ENABLED", "true").lower() == "true"
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")  # Readers no longer block the writer
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # Safe with WAL, one fsync per checkpoint
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return _is_sqlite(url) and (":memory:" in url or url.rstrip("/").endswith("sqlite:"))
+
+
+def engine_options(url: str, **overrides) -> dict:
+    """create_engine() keyword arguments for `url` from the pool settings above"""
+    options = {}
+    if not _is_sqlite_memory(url):
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_timeout=DB_POOL_TIMEOUT)
+    if not _is_sqlite(url):
+        options.update(pool_pre_ping=DB_POOL_PRE_PING, pool_recycle=DB_POOL_RECYCLE)
+    options.update(overrides)
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record=None):
+    """Connect-event hook applying the SQLITE_* pragmas"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def set_sqlite_query_only(dbapi_connection, connection_record=None):
+    """Connect-event hook rejecting writes on read-only SQLite engines"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def create_db_engine(url: str, sqlite_pragmas: bool = SQLITE_PRAGMAS_ENABLED, read_only: bool = False, **overrides):
+    """Engine with the configured pool and, for SQLite, the performance pragmas"""
+    connect_args = {"check_same_thread": False} if _is_sqlite(url) else {}
+    db_engine = create_engine(url, connect_args=connect_args, **engine_options(url, **overrides))
+    if sqlite_pragmas and _is_sqlite(url):
+        event.listen(db_engine, "connect", set_sqlite_pragmas)
+    if read_only:
+        if _is_sqlite(url):
+            event.listen(db_engine, "connect", set_sqlite_query_only)
+        else:
+            db_engine = db_engine.execution_options(postgresql_readonly=True)
+    return db_engine
+
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+engine = create_db_engine(DATABASE_URL)
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Optional read replica for the admin read endpoints; unset means reads use the primary
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "")
+# Look a review up on the primary when the replica has not caught up with a fresh submit yet
+READ_YOUR_WRITES_FALLBACK = os.getenv("READ_YOUR_WRITES_FALLBACK", "true").lower() == "true"
+
+if DATABASE_READ_URL:
+    read_engine = create_db_engine(DATABASE_READ_URL, read_only=True)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
+# Serve submissions and single-review reads from async endpoints on an AsyncEngine
+ASYNC_API = os.getenv("ASYNC_API", "false").lower() == "true"
+
+
+def _async_database_url(url: str) -> str:
+    """Same database through its asyncio driver (aiosqlite / asyncpg)"""
+    scheme, _, rest = url.partition("://")
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _async_database_url(DATABASE_URL))
+ASYNC_DATABASE_READ_URL = os.getenv(
+    "ASYNC_DATABASE_READ_URL", _async_database_url(DATABASE_READ_URL) if DATABASE_READ_URL else ""
+)
+
+# Created only in async mode so the sync app does not need the async drivers
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+if ASYNC_API:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL))
+    if SQLITE_PRAGMAS_ENABLED and _is_sqlite(ASYNC_DATABASE_URL):
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    
+    if ASYNC_DATABASE_READ_URL:
+        # Same read-only guards as the sync read engine
+        async_read_engine = create_async_engine(ASYNC_DATABASE_READ_URL, **engine_options(ASYNC_DATABASE_READ_URL))
+        if _is_sqlite(ASYNC_DATABASE_READ_URL):
+            if SQLITE_PRAGMAS_ENABLED:
+                event.listen(async_read_engine.sync_engine, "connect", set_sqlite_pragmas)
+            event.listen(async_read_engine.sync_engine, "connect", set_sqlite_query_only)
+        else:
+            async_read_engine = async_read_engine.execution_options(postgresql_readonly=True)
+        AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+    else:
+        async_read_engine = async_engine
+        AsyncReadSessionLocal = AsyncSessionLocal
+
 # Base class for models
 Base = declarative_base()
 
+# Review enrichment states
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
 
 # Database Models
 class Review(Base):
@@ -29,19 +155,62 @@ class Review(Base):
     __tablename__ = "reviews"
     
     id = Column(String, primary_key=True, index=True)
+    customer_name = Column(String(50), nullable=True)  # Kept so deferred enrichment can personalize the response
     rating = Column(Integer, nullable=False)
     review_text = Column(Text, nullable=False)
     summary = Column(Text, nullable=True)
     recommended_actions = Column(JSON, nullable=True)  # List of strings
     user_response = Column(Text, nullable=True)
+    status = Column(String(20), nullable=False, default=STATUS_COMPLETED, index=True)
+    severity = Column(Integer, nullable=True)  # LLM-assessed 1-5; None when not assessed
+    urgency_score = Column(Float, nullable=True)  # Undecayed score, see priority.py
+    priority_rank = Column(Float, nullable=True)  # log2(urgency_score) + age decay term
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # Newest-first listing and keyset pagination over (created_at, id)
+        Index("ix_reviews_created_at_id", created_at.desc(), id.desc()),
+        # Rating filter ordered by recency
+        Index("ix_reviews_rating_created_at", rating, created_at.desc(), id.desc()),
+        # Priority queue: top-k by rank is a single descending range read
+        Index("ix_reviews_priority_rank", priority_rank.desc()),
+    )
+
+
+class ReviewRatingRollup(Base):
+    """Per-rating review counts, updated in the same transaction as each insert"""
+    __tablename__ = "review_rating_rollups"
+    
+    rating = Column(Integer, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+
+
+class ReviewTimeBucket(Base):
+    """Hourly and daily review counts, updated in the same transaction as each insert"""
+    __tablename__ = "review_time_buckets"
+    
+    granularity = Column(String(10), primary_key=True)  # "hour" or "day"
+    bucket_start = Column(DateTime, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+
+
+class DataVersion(Base):
+    """Change counter per dataset, bumped in the same transaction as every write (backs HTTP ETags)"""
+    __tablename__ = "data_versions"
+    
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
 
 # Create tables
 def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    """Bring the database schema up to date with the versioned migrations"""
+    from migrations import run_migrations
+    run_migrations(engine)
 
 
 # Dependency to get database session
@@ -52,3 +221,27 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get a read-only database session
+def get_read_db():
+    """Get a session on the read replica (the primary when DATABASE_READ_URL is unset)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    """Get async database session (ASYNC_API=true)"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency to get a read-only async database session
+async def get_async_read_db():
+    """Get an async session on the read replica (the primary when DATABASE_READ_URL is unset)"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
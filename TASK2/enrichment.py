@@ -0,0 +1,165 @@
+import os
+import queue
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from database import (
+    SessionLocal,
+    Review,
+    STATUS_PENDING,
+    STATUS_PROCESSING,
+    STATUS_COMPLETED,
+    STATUS_FAILED
+)
+from ai_service import ai_service
+import priority
+import events
+import rollups
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Accept reviews immediately (202) and fill in the AI fields in the background
+ASYNC_ENRICHMENT = os.getenv("ASYNC_ENRICHMENT", "false").lower() == "true"
+# Number of background threads enriching pending reviews
+ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", "4"))
+# Seconds after which a review stuck in processing (its worker died) is handed out again
+ENRICHMENT_LEASE_SECONDS = int(os.getenv("ENRICHMENT_LEASE_SECONDS", "600"))
+
+
+class EnrichmentQueue:
+    """In-process queue that enriches pending reviews with AI outputs"""
+    
+    def __init__(self, num_workers: int = ENRICHMENT_WORKERS):
+        self.num_workers = num_workers
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+    
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+    
+    def start(self):
+        """Start the worker pool and re-queue reviews left pending by a previous run"""
+        if self.running:
+            return
+        
+        for i in range(self.num_workers):
+            thread = threading.Thread(target=self._worker, name=f"enrichment-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        
+        recovered = self._recover_pending()
+        logger.info(f"Enrichment queue started with {self.num_workers} workers ({recovered} pending reviews recovered)")
+    
+    def stop(self):
+        """Signal all workers to exit once the queue is drained"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout=30)
+        self._threads = []
+    
+    def enqueue(self, review_id: str):
+        """Schedule a review for enrichment"""
+        self._queue.put(review_id)
+    
+    def pending_count(self) -> int:
+        """Number of reviews waiting for a worker"""
+        return self._queue.qsize()
+    
+    def _recover_pending(self) -> int:
+        """
+        The reviews table is the durable queue: pending reviews get picked up again
+        
+        Reviews whose processing lease expired go back to pending first. Every worker
+        process does this on startup, so a review may be queued more than once; the
+        claim in _enrich() makes sure only one of them enriches it.
+        """
+        db = SessionLocal()
+        try:
+            lease_expired = datetime.utcnow() - timedelta(seconds=ENRICHMENT_LEASE_SECONDS)
+            db.query(Review).filter(
+                Review.status == STATUS_PROCESSING,
+                Review.updated_at < lease_expired
+            ).update({Review.status: STATUS_PENDING}, synchronize_session=False)
+            db.commit()
+            
+            rows = db.query(Review.id).filter(
+                Review.status == STATUS_PENDING
+            ).order_by(Review.created_at).all()
+        finally:
+            db.close()
+        
+        for (review_id,) in rows:
+            self.enqueue(review_id)
+        return len(rows)
+    
+    def _worker(self):
+        while True:
+            review_id = self._queue.get()
+            try:
+                if review_id is None:
+                    return
+                self._enrich(review_id)
+            finally:
+                self._queue.task_done()
+    
+    def _enrich(self, review_id: str):
+        """Generate AI outputs for one review and store them"""
+        db = SessionLocal()
+        try:
+            # Claim the review atomically; another worker (or process) may have got it first
+            claimed = db.query(Review).filter(
+                Review.id == review_id,
+                Review.status == STATUS_PENDING
+            ).update({Review.status: STATUS_PROCESSING, Review.updated_at: datetime.utcnow()}, synchronize_session=False)
+            if claimed != 1:
+                db.rollback()
+                return
+            rollups.bump_version(db)
+            db.commit()
+            
+            review = db.query(Review).filter(Review.id == review_id).first()
+            
+            user_response, summary, recommended_actions, severity = ai_service.analyze_review(
+                review.customer_name or "Customer",
+                review.rating,
+                review.review_text
+            )
+            
+            review.user_response = user_response
+            review.summary = summary
+            review.recommended_actions = recommended_actions
+            # Rescore with the LLM severity; the rank keeps using the original created_at
+            for field, value in priority.score_fields(review.rating, review.review_text, review.created_at, severity).items():
+                setattr(review, field, value)
+            review.status = STATUS_COMPLETED
+            rollups.bump_version(db)
+            db.commit()
+            events.publish_review_updated(review)
+            
+            logger.info(f"Review enriched: id={review_id}")
+            
+        except Exception as e:
+            logger.error(f"Error enriching review {review_id}: {str(e)}")
+            db.rollback()
+            self._mark_failed(db, review_id)
+        finally:
+            db.close()
+    
+    def _mark_failed(self, db, review_id: str):
+        try:
+            db.query(Review).filter(Review.id == review_id).update({Review.status: STATUS_FAILED})
+            rollups.bump_version(db)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Could not mark review {review_id} as failed: {str(e)}")
+            db.rollback()
+
+
+# Singleton instance
+enrichment_queue = EnrichmentQueue()
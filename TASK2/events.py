@@ -0,0 +1,215 @@
+"""
+In-process pub/sub behind GET /api/events (server-sent events)
+Write paths publish one event per stored or enriched review; every connected
+admin receives it instead of re-polling /api/reviews/priority and /api/analytics.
+Events only reach subscribers in the same process, so run a single API worker
+(or put a shared broker in front) when admins rely on the live feed.
+"""
+
+import os
+import json
+import signal
+import asyncio
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+import priority
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds between keep-alive comments so proxies do not close idle streams
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+# Events buffered per subscriber before it is told to resync
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "1000"))
+# Recent events kept for clients reconnecting with Last-Event-ID
+EVENTS_REPLAY_SIZE = int(os.getenv("EVENTS_REPLAY_SIZE", "500"))
+
+REVIEW_CREATED = "review.created"
+REVIEW_UPDATED = "review.updated"
+RESYNC = "resync"
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[tuple]]" = asyncio.Queue(maxsize=queue_size)
+        self.lagged = False
+
+
+class EventBroker:
+    """Fan-out of events to SSE subscribers; publish() is safe from any thread"""
+
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE, replay_size: int = EVENTS_REPLAY_SIZE):
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._recent = deque(maxlen=replay_size)
+        self._last_id = 0
+        self._published = 0
+        self._resyncs = 0
+        self._lock = threading.Lock()
+
+    def publish(self, event_type: str, data: dict):
+        """Send an event to every subscriber; never blocks the caller"""
+        with self._lock:
+            self._last_id += 1
+            event = (self._last_id, event_type, json.dumps(data, default=_json_default))
+            self._recent.append(event)
+            self._published += 1
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, event)
+            except RuntimeError:
+                # The subscriber's event loop has shut down
+                self._remove(subscriber)
+
+    def _deliver(self, subscriber: _Subscriber, event: Optional[tuple]):
+        if subscriber.lagged:
+            return
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow client gets one resync instead of an unbounded backlog
+            subscriber.lagged = True
+            with self._lock:
+                self._resyncs += 1
+
+    def _remove(self, subscriber: _Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    async def stream(self, last_event_id: Optional[int] = None, is_disconnected=None):
+        """Yield SSE-formatted text for one client until it disconnects or the broker closes"""
+        subscriber = _Subscriber(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+            backlog = list(self._recent)
+
+        try:
+            yield "retry: 3000\n\n"
+            if last_event_id is not None and backlog:
+                if backlog[0][0] > last_event_id + 1 or last_event_id > backlog[-1][0]:
+                    # Missed events are gone (or the server restarted); the client must reload its state
+                    yield _format((backlog[-1][0], RESYNC, "{}"))
+                else:
+                    for event in backlog:
+                        if event[0] > last_event_id:
+                            yield _format(event)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), timeout=EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if is_disconnected and await is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    return
+                yield _format(event)
+
+                if subscriber.lagged:
+                    while not subscriber.queue.empty():
+                        subscriber.queue.get_nowait()
+                    subscriber.lagged = False
+                    yield _format((self._last_id, RESYNC, "{}"))
+        finally:
+            self._remove(subscriber)
+
+    def close(self):
+        """Wake every open stream so server shutdown does not wait on idle clients"""
+        # No lock: this can run inside a signal handler on the thread that holds it
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.queue.put_nowait, None)
+            except (RuntimeError, asyncio.QueueFull):
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self._published,
+                "resyncs": self._resyncs,
+                "last_event_id": self._last_id
+            }
+
+
+def close_on_server_exit():
+    """
+    End open streams as soon as the server receives SIGINT/SIGTERM
+    
+    uvicorn waits for in-flight responses before running shutdown handlers, and an
+    event stream never finishes by itself, so closing from a shutdown handler is too late.
+    Wraps the server's own signal handlers; call from a startup handler.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+        if not callable(previous) or getattr(previous, "closes_event_streams", False):
+            continue
+        
+        def handler(signum, frame, previous=previous):
+            event_broker.close()
+            previous(signum, frame)
+        
+        handler.closes_event_streams = True
+        signal.signal(sig, handler)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _format(event: tuple) -> str:
+    event_id, event_type, data = event
+    return f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n"
+
+
+def review_payload(review) -> dict:
+    """Admin view of a Review row or an ingest row dict, with its current urgency"""
+    get = review.get if isinstance(review, dict) else (lambda name: getattr(review, name, None))
+    rank = get("priority_rank")
+    urgency = priority.current_urgency(rank) if rank is not None else None
+    return {
+        "id": get("id"),
+        "rating": get("rating"),
+        "review_text": get("review_text"),
+        "summary": get("summary"),
+        "recommended_actions": get("recommended_actions"),
+        "user_response": get("user_response"),
+        "status": get("status"),
+        "created_at": get("created_at"),
+        "severity": get("severity"),
+        "urgency": round(urgency, 2) if urgency is not None else None,
+        "urgent": urgency is not None and urgency >= priority.PRIORITY_URGENT_THRESHOLD
+    }
+
+
+def publish_review_created(review):
+    """New review plus the change it makes to the analytics totals"""
+    payload = review_payload(review)
+    event_broker.publish(REVIEW_CREATED, {
+        "review": payload,
+        "analytics_delta": {"rating": payload["rating"], "count": 1}
+    })
+
+
+def publish_review_updated(review):
+    """Review whose AI fields or urgency changed (e.g. after background enrichment)"""
+    event_broker.publish(REVIEW_UPDATED, {"review": review_payload(review)})
+
+
+# Singleton instance
+event_broker = EventBroker()
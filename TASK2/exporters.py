@@ -0,0 +1,227 @@
+import os
+import io
+import csv
+import json
+import zlib
+import logging
+from typing import List, Optional
+
+from database import ReadSessionLocal, Review
+from pagination import newest_first
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round-trip and flushed per chunk
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+# Exportable columns: name -> (model column, CSV header)
+EXPORT_COLUMNS = {
+    'id': (Review.id, 'ID'),
+    'rating': (Review.rating, 'Rating'),
+    'review_text': (Review.review_text, 'Review Text'),
+    'summary': (Review.summary, 'Summary'),
+    'recommended_actions': (Review.recommended_actions, 'Recommended Actions'),
+    'user_response': (Review.user_response, 'User Response'),
+    'created_at': (Review.created_at, 'Created At'),
+}
+
+# format -> (media type, file extension, allowed compression codecs)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv', ('none', 'gzip')),
+    'ndjson': ('application/x-ndjson', 'ndjson', ('none', 'gzip')),
+    'parquet': ('application/vnd.apache.parquet', 'parquet', ('none', 'snappy', 'gzip', 'zstd')),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows', ('none', 'lz4', 'zstd')),
+}
+
+
+def parse_columns(columns: Optional[str]) -> List[str]:
+    """Parse a comma-separated column list, defaulting to every column"""
+    if not columns:
+        return list(EXPORT_COLUMNS)
+
+    names = [name.strip() for name in columns.split(',') if name.strip()]
+    unknown = [name for name in names if name not in EXPORT_COLUMNS]
+    if unknown or not names:
+        raise ValueError(
+            f"Unknown export columns: {', '.join(unknown) or columns}. "
+            f"Choose from: {', '.join(EXPORT_COLUMNS)}"
+        )
+    # Drop duplicates but keep the requested order
+    return list(dict.fromkeys(names))
+
+
+def iter_review_rows(db, rating: Optional[int] = None, batch_size: int = EXPORT_BATCH_SIZE,
+                     columns: Optional[List[str]] = None):
+    """Stream export rows in batches (server-side cursor on Postgres) without loading the table"""
+    columns = columns or list(EXPORT_COLUMNS)
+    query = db.query(*[EXPORT_COLUMNS[name][0] for name in columns])
+    if rating is not None:
+        query = query.filter(Review.rating == rating)
+
+    return newest_first(query).execution_options(stream_results=True, yield_per=batch_size)
+
+
+def iter_review_batches(rating: Optional[int], columns: List[str], batch_size: int = EXPORT_BATCH_SIZE):
+    """Yield lists of rows on a dedicated replica session (the request session may close before streaming ends)"""
+    db = ReadSessionLocal()
+    try:
+        batch = []
+        for row in iter_review_rows(db, rating, batch_size, columns):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    except Exception as e:
+        # Headers are already sent, so the client sees a truncated file rather than a 500
+        logger.error(f"Error streaming reviews export: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
+def _csv_chunks(rating, columns, batch_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # Send the header straight away so the first byte does not wait for the query
+    writer.writerow([EXPORT_COLUMNS[name][1] for name in columns])
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+
+    for batch in iter_review_batches(rating, columns, batch_size):
+        for row in batch:
+            values = []
+            for name, value in zip(columns, row):
+                if name == 'recommended_actions':
+                    value = ', '.join(value) if value else ''
+                elif name == 'created_at':
+                    value = value.isoformat()
+                elif value is None:
+                    value = ''
+                values.append(value)
+            writer.writerow(values)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def _ndjson_chunks(rating, columns, batch_size):
+    for batch in iter_review_batches(rating, columns, batch_size):
+        lines = []
+        for row in batch:
+            record = dict(zip(columns, row))
+            if 'created_at' in record:
+                record['created_at'] = record['created_at'].isoformat()
+            lines.append(json.dumps(record, ensure_ascii=False))
+        yield '\n'.join(lines) + '\n'
+
+
+def _arrow_schema(pa, columns):
+    types = {
+        'id': pa.string(),
+        'rating': pa.int8(),
+        'review_text': pa.string(),
+        'summary': pa.string(),
+        'recommended_actions': pa.list_(pa.string()),
+        'user_response': pa.string(),
+        'created_at': pa.timestamp('us'),
+    }
+    return pa.schema([(name, types[name]) for name in columns])
+
+
+class _ChunkSink:
+    """Write-only file object that hands back whatever the Arrow writers produced since the last drain"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _arrow_chunks(rating, columns, batch_size, file_format, compression):
+    import pyarrow as pa
+
+    schema = _arrow_schema(pa, columns)
+    sink = _ChunkSink()
+    codec = None if compression == 'none' else compression
+
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(sink, schema, compression=codec or 'none')
+    else:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression=codec))
+
+    try:
+        for batch in iter_review_batches(rating, columns, batch_size):
+            arrays = {name: [row[i] for row in batch] for i, name in enumerate(columns)}
+            # One row group / IPC message per batch, flushed as soon as it is encoded
+            writer.write_batch(pa.RecordBatch.from_pydict(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        # Z_SYNC_FLUSH keeps the stream moving batch by batch instead of buffering in zlib
+        yield data + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def build_export(file_format: str = 'csv', columns: Optional[str] = None, compression: str = 'none',
+                 rating: Optional[int] = None, batch_size: int = EXPORT_BATCH_SIZE):
+    """
+    Validate export options and return (chunk iterator, media type, file extension)
+
+    Raises ValueError for bad options and ImportError when pyarrow is needed but missing
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}. Choose from: {', '.join(EXPORT_FORMATS)}")
+
+    media_type, extension, codecs = EXPORT_FORMATS[file_format]
+    compression = (compression or 'none').lower()
+    if compression not in codecs:
+        raise ValueError(f"Unsupported compression for {file_format}: {compression}. Choose from: {', '.join(codecs)}")
+
+    names = parse_columns(columns)
+
+    if file_format in ('parquet', 'arrow'):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(f"{file_format} export requires pyarrow (pip install pyarrow)")
+        return _arrow_chunks(rating, names, batch_size, file_format, compression), media_type, extension
+
+    chunks = _csv_chunks(rating, names, batch_size) if file_format == 'csv' else _ndjson_chunks(rating, names, batch_size)
+    if compression == 'gzip':
+        return _gzip_chunks(chunks), 'application/gzip', f"{extension}.gz"
+    return chunks, media_type, extension
+
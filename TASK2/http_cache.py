@@ -0,0 +1,83 @@
+"""
+Conditional GET support for the admin read endpoints
+ETags are built from the reviews data version (a counter bumped in every write
+transaction, see rollups.bump_version), so a revalidation costs one primary-key
+read: an unchanged dashboard gets 304 without running the main query or building
+the response models.
+"""
+
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Browsers keep the response but revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+# Analytics include a sliding last-24h count, so their ETag also changes every this many seconds
+ANALYTICS_ETAG_SECONDS = int(os.getenv("ANALYTICS_ETAG_SECONDS", "60"))
+
+
+def make_etag(scope: str, version: int, window: Optional[int] = None) -> str:
+    """Weak ETag for one endpoint's view of a data version (and time window)"""
+    tag = f"{scope}-{version}" if window is None else f"{scope}-{version}-{window}"
+    return f'W/"{tag}"'
+
+
+def time_window(seconds: int = ANALYTICS_ETAG_SECONDS, now: Optional[datetime] = None) -> int:
+    """Index of the current window of `seconds`, for representations that change with time"""
+    now = now or datetime.utcnow()
+    return int(now.replace(tzinfo=timezone.utc).timestamp()) // max(seconds, 1)
+
+
+def window_start(window: int, seconds: int = ANALYTICS_ETAG_SECONDS) -> datetime:
+    return datetime.utcfromtimestamp(window * max(seconds, 1))
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent (RFC 9110 13.2.2)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or _strip_weak(etag) in {_strip_weak(tag) for tag in tags}
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        # HTTP dates have whole-second precision
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime]):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified:
+        response.headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    """Empty 304 carrying the same validators as the full response"""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified)
+    return response
+
+
+def cached_response(request: Request, entry) -> Response:
+    """Serve a response_cache entry: 304 when the client already has it, else the stored JSON body"""
+    if entry.etag and is_not_modified(request, entry.etag, entry.last_modified):
+        return not_modified(entry.etag, entry.last_modified)
+    response = Response(content=entry.body, media_type="application/json")
+    if entry.etag:
+        set_cache_headers(response, entry.etag, entry.last_modified)
+    return response
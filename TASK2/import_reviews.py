@@ -0,0 +1,255 @@
+"""
+Bulk import reviews from JSONL or CSV into the reviews table
+The input is streamed record by record and inserted in chunks, one transaction
+per chunk. A checkpoint file records how far the import got, so a crashed run
+can be restarted with the same command and picks up where it stopped.
+
+Usage:
+    python import_reviews.py reviews.jsonl
+    python import_reviews.py ../TASK1/yelp.csv --enrich defer --chunk-size 1000
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import uuid
+import argparse
+import logging
+from datetime import datetime
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from database import SessionLocal, Review, init_db, STATUS_PENDING, STATUS_COMPLETED
+from models import ReviewSubmitRequest
+from ingest import chunked, build_review_row, enrich_rows, insert_reviews, INGEST_CHUNK_SIZE, INGEST_ENRICHMENT_CONCURRENCY
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Namespace for ids derived from (source, record number) when the input has no id column
+IMPORT_NAMESPACE = uuid.UUID("7d9c1f2e-5b8a-4e31-9a6f-0c2d4b7e8f13")
+
+# Accepted spellings of each field (TASK2 API names first, then yelp.csv names)
+FIELD_ALIASES = {
+    "id": ("id", "review_id"),
+    "name": ("name", "customer_name", "user_name"),
+    "rating": ("rating", "stars"),
+    "review_text": ("review_text", "text"),
+    "created_at": ("created_at", "date"),
+}
+
+ENRICH_NONE = "none"
+ENRICH_INLINE = "inline"
+ENRICH_DEFER = "defer"
+
+
+class MalformedRecord(NamedTuple):
+    """Input line that could not be parsed; still counts as a record so numbering stays stable"""
+    error: str
+
+
+def iter_records(path: str, file_format: str) -> Iterator[Union[dict, MalformedRecord]]:
+    """Yield input records one at a time without reading the whole file"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield MalformedRecord(f"invalid JSON: {e.msg} (column {e.colno})")
+                continue
+            yield record if isinstance(record, dict) else MalformedRecord(f"expected a JSON object, got {type(record).__name__}")
+
+
+def _pick(record: dict, field: str):
+    for key in FIELD_ALIASES[field]:
+        value = record.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _parse_created_at(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def to_row(record: dict, record_no: int, source_key: str, status: str, default_name: str) -> Tuple[Optional[dict], Optional[str]]:
+    """Map one input record to a reviews row; returns (row, error)"""
+    try:
+        request = ReviewSubmitRequest.model_validate({
+            "name": str(_pick(record, "name") or default_name)[:50],
+            "rating": _pick(record, "rating"),
+            "review_text": _pick(record, "review_text"),
+        })
+    except ValidationError as e:
+        return None, "; ".join(f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors())
+
+    # Deterministic ids make re-running a chunk after a crash idempotent
+    review_id = str(_pick(record, "id") or uuid.uuid5(IMPORT_NAMESPACE, f"{source_key}:{record_no}"))
+    row = build_review_row(
+        request.name,
+        request.rating,
+        request.review_text,
+        status=status,
+        review_id=review_id,
+        created_at=_parse_created_at(_pick(record, "created_at"))
+    )
+    return row, None
+
+
+def load_checkpoint(path: str, source_key: str) -> int:
+    """Number of input records already committed by a previous run"""
+    if not os.path.exists(path):
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("source") != source_key:
+        raise SystemExit(f"Checkpoint {path} belongs to {state.get('source')}, not {source_key}; pass --checkpoint or --restart")
+    return int(state.get("records", 0))
+
+
+def save_checkpoint(path: str, source_key: str, records: int, stats: dict):
+    """Atomically record progress (written after each chunk commits)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"source": source_key, "records": records, **stats}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def run_import(
+    path: str,
+    file_format: Optional[str] = None,
+    chunk_size: int = INGEST_CHUNK_SIZE,
+    enrich: str = ENRICH_NONE,
+    concurrency: int = INGEST_ENRICHMENT_CONCURRENCY,
+    checkpoint_path: Optional[str] = None,
+    source_key: Optional[str] = None,
+    default_name: str = "Customer",
+    restart: bool = False,
+    progress_every: float = 2.0
+) -> dict:
+    """Stream `path` into the reviews table; returns counters for the run"""
+    file_format = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    source_key = source_key or os.path.basename(path)
+    checkpoint_path = checkpoint_path or f"{path}.import-checkpoint.json"
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    # Deferred rows stay pending; the API's enrichment queue picks them up on startup
+    status = STATUS_PENDING if enrich == ENRICH_DEFER else STATUS_COMPLETED
+
+    resume_from = load_checkpoint(checkpoint_path, source_key)
+    if resume_from:
+        logger.info(f"Resuming {source_key} after {resume_from} records")
+
+    stats = {"inserted": 0, "skipped_existing": 0, "duplicates": 0, "invalid": 0}
+    records_done = resume_from
+    started = time.time()
+    last_report = started
+
+    records = ((no, record) for no, record in enumerate(iter_records(path, file_format)) if no >= resume_from)
+    db = SessionLocal()
+    try:
+        for chunk in chunked(records, chunk_size):
+            rows = []
+            chunk_ids = set()
+            for record_no, record in chunk:
+                if isinstance(record, MalformedRecord):
+                    row, error = None, record.error
+                else:
+                    row, error = to_row(record, record_no, source_key, status, default_name)
+                if error:
+                    stats["invalid"] += 1
+                    logger.warning(f"Skipping record {record_no}: {error}")
+                elif row["id"] in chunk_ids:
+                    # A repeated id would fail the whole bulk insert; the first record wins
+                    stats["duplicates"] += 1
+                    logger.warning(f"Skipping record {record_no}: duplicate id {row['id']}")
+                else:
+                    chunk_ids.add(row["id"])
+                    rows.append(row)
+
+            # Rows committed by a run that crashed before saving its checkpoint
+            existing = {
+                review_id for (review_id,) in
+                db.query(Review.id).filter(Review.id.in_([row["id"] for row in rows])).all()
+            } if rows else set()
+            rows = [row for row in rows if row["id"] not in existing]
+            stats["skipped_existing"] += len(existing)
+
+            if enrich == ENRICH_INLINE and rows:
+                errors = enrich_rows(rows, concurrency)
+                # Failed enrichments are stored as pending so the queue retries them
+                for row, error in zip(rows, errors):
+                    if error:
+                        row["status"] = STATUS_PENDING
+
+            insert_reviews(db, rows)
+            db.commit()
+            stats["inserted"] += len(rows)
+            records_done = chunk[-1][0] + 1
+            save_checkpoint(checkpoint_path, source_key, records_done, stats)
+
+            now = time.time()
+            if now - last_report >= progress_every:
+                elapsed = now - started
+                print(f"{records_done} records | {stats['inserted']} inserted | "
+                      f"{stats['inserted'] / elapsed:.0f} rows/s", flush=True)
+                last_report = now
+    finally:
+        db.close()
+
+    elapsed = max(time.time() - started, 1e-9)
+    stats.update({"records": records_done, "seconds": round(elapsed, 2), "rows_per_second": round(stats["inserted"] / elapsed, 1)})
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import reviews from JSONL or CSV")
+    parser.add_argument("path", help="Input file (.jsonl or .csv)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Input format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=INGEST_CHUNK_SIZE, help="Rows per bulk insert / transaction")
+    parser.add_argument("--enrich", choices=[ENRICH_NONE, ENRICH_INLINE, ENRICH_DEFER], default=ENRICH_NONE,
+                        help="none: no AI fields; inline: enrich while importing; defer: store as pending for the enrichment queue")
+    parser.add_argument("--concurrency", type=int, default=INGEST_ENRICHMENT_CONCURRENCY, help="Reviews enriched at once with --enrich inline")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.import-checkpoint.json)")
+    parser.add_argument("--source-key", help="Stable name for this input, used for derived ids (default: file name)")
+    parser.add_argument("--default-name", default="Customer", help="Customer name for records without one")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start from the first record")
+    args = parser.parse_args()
+
+    init_db()
+    stats = run_import(
+        args.path,
+        file_format=args.format,
+        chunk_size=args.chunk_size,
+        enrich=args.enrich,
+        concurrency=args.concurrency,
+        checkpoint_path=args.checkpoint,
+        source_key=args.source_key,
+        default_name=args.default_name,
+        restart=args.restart
+    )
+    print(json.dumps(stats, indent=2))
+    if args.enrich == ENRICH_DEFER:
+        print("Rows are pending; start the API with ASYNC_ENRICHMENT=true to enrich them")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
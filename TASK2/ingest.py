@@ -0,0 +1,100 @@
+import os
+import uuid
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database import Review, STATUS_COMPLETED
+from ai_service import ai_service
+import rollups
+import priority
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Rows per bulk INSERT / transaction
+INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "500"))
+# Largest array accepted by POST /api/reviews/batch
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+# Reviews enriched at once during bulk ingest (each may fan out to several LLM calls)
+INGEST_ENRICHMENT_CONCURRENCY = int(os.getenv("INGEST_ENRICHMENT_CONCURRENCY", "8"))
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most `size` items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def build_review_row(
+    name: str,
+    rating: int,
+    review_text: str,
+    status: str = STATUS_COMPLETED,
+    review_id: Optional[str] = None,
+    created_at: Optional[datetime] = None
+) -> dict:
+    """Column values for one reviews row, without AI fields (scored without LLM severity)"""
+    now = datetime.utcnow()
+    created_at = created_at or now
+    return {
+        "id": review_id or str(uuid.uuid4()),
+        "customer_name": name,
+        "rating": rating,
+        "review_text": review_text,
+        "summary": None,
+        "recommended_actions": None,
+        "user_response": None,
+        "status": status,
+        "created_at": created_at,
+        "updated_at": now,
+        **priority.score_fields(rating, review_text, created_at)
+    }
+
+
+def enrich_rows(rows: List[dict], max_workers: int = INGEST_ENRICHMENT_CONCURRENCY) -> List[Optional[str]]:
+    """
+    Fill in the AI fields of each row in place with bounded concurrency
+    
+    Returns one error message (or None) per row
+    """
+    def enrich(row):
+        user_response, summary, recommended_actions, severity = ai_service.analyze_review(
+            row["customer_name"] or "Customer",
+            row["rating"],
+            row["review_text"]
+        )
+        row["user_response"] = user_response
+        row["summary"] = summary
+        row["recommended_actions"] = recommended_actions
+        row.update(priority.score_fields(row["rating"], row["review_text"], row["created_at"], severity))
+    
+    errors: List[Optional[str]] = [None] * len(rows)
+    # A pool of its own: analyze_review already fans out on ai_service's executor
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(rows) or 1))) as pool:
+        futures = [pool.submit(enrich, row) for row in rows]
+        for i, future in enumerate(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error enriching review {rows[i]['id']}: {str(e)}")
+                errors[i] = str(e)
+    return errors
+
+
+def insert_reviews(db: Session, rows: List[dict]):
+    """One multi-row INSERT plus the matching rollup update; the caller commits"""
+    if not rows:
+        return
+    db.execute(insert(Review), rows)
+    rollups.record_reviews(db, [(row["rating"], row["created_at"]) for row in rows])
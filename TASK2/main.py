@@ -1,13 +1,13 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Response, Body, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import datetime, timedelta
+from sqlalchemy import desc, func
+from datetime import datetime
 import uuid
 import logging
-import csv
-import io
+from typing import Any, List, Optional
+from pydantic import ValidationError
 
 from models import (
     ReviewSubmitRequest,
@@ -16,10 +16,42 @@ from models import (
     AdminReviewItem,
     AnalyticsResponse,
     PriorityReviewsResponse,
+    PriorityReviewItem,
+    ReviewStatusResponse,
+    ReviewBatchResponse,
+    BatchItemResult,
+    ReviewSearchItem,
+    ReviewSearchResponse,
     ErrorResponse
 )
-from database import get_db, init_db, Review
+from database import (
+    get_db,
+    get_read_db,
+    init_db,
+    SessionLocal,
+    Review,
+    engine,
+    read_engine,
+    async_engine,
+    async_read_engine,
+    STATUS_PENDING,
+    STATUS_COMPLETED,
+    ASYNC_API,
+    DATABASE_READ_URL,
+    READ_YOUR_WRITES_FALLBACK
+)
 from ai_service import ai_service
+from enrichment import enrichment_queue, ASYNC_ENRICHMENT
+import rollups
+import search
+import priority
+import events
+import http_cache
+import metrics
+from response_cache import response_cache
+from pagination import encode_cursor, decode_cursor, newest_first, after_cursor
+from exporters import build_export
+from ingest import chunked, build_review_row, enrich_rows, insert_reviews, INGEST_CHUNK_SIZE, BATCH_MAX_ITEMS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -41,12 +73,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency per route for GET /metrics
+if metrics.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 # Initialize database on startup
 @app.on_event("startup")
 def startup_event():
     logger.info("Initializing database...")
     init_db()
     logger.info("Database initialized successfully")
+    
+    events.close_on_server_exit()
+    
+    if ASYNC_ENRICHMENT:
+        enrichment_queue.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    events.event_broker.close()
+    if ASYNC_ENRICHMENT:
+        enrichment_queue.stop()
 
 
 # Health check endpoint
@@ -59,10 +107,67 @@ def read_root():
     }
 
 
+# Live admin feed (Admin-facing)
+@app.get("/api/events")
+async def stream_events(request: Request, last_event_id: Optional[str] = Header(None)):
+    """
+    Server-sent events for the admin dashboard
+    
+    - **review.created**: a stored review (with its urgency) and the analytics delta it causes
+    - **review.updated**: a review whose AI fields or urgency changed after enrichment
+    - **resync**: events were missed; reload from the REST endpoints
+    
+    Browsers reconnect on their own and send Last-Event-ID, so short gaps are replayed
+    """
+    try:
+        last_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_id = None
+    
+    return StreamingResponse(
+        events.event_broker.stream(last_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# AI service stats endpoint
+@app.get("/api/ai/stats")
+def get_ai_stats():
+    """LLM call, retry, circuit breaker, rate limiter and cache counters"""
+    return ai_service.get_stats()
+
+
+# Response cache stats endpoint
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Hit ratio, size, invalidations and staleness of the analytics/priority response cache"""
+    return response_cache.stats()
+
+
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Request and stage latency histograms, LLM counters and token usage, cache and pool stats"""
+    if not metrics.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["read"] = read_engine
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    if async_read_engine is not async_engine:
+        engines["async_read"] = async_read_engine.sync_engine
+    body = metrics.render(ai_service.get_stats(), engines, response_cache.stats())
+    return Response(content=body, media_type=metrics.CONTENT_TYPE)
+
+
 # Submit review endpoint (User-facing)
-@app.post("/api/reviews", response_model=ReviewSubmitResponse, responses={422: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+@app.post("/api/reviews", response_model=ReviewSubmitResponse, responses={202: {"model": ReviewSubmitResponse}, 422: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
 def submit_review(
     review_request: ReviewSubmitRequest,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -71,34 +176,47 @@ def submit_review(
     - **rating**: Star rating from 1 to 5
     - **review_text**: Review text (10-5000 characters)
     
-    Returns AI-generated response for the user
+    Returns AI-generated response for the user. When async enrichment is enabled,
+    returns 202 with status "pending"; poll /api/reviews/{id}/status for the response.
     """
     try:
         logger.info(f"Received review submission: rating={review_request.rating}")
         
+        if ASYNC_ENRICHMENT:
+            return _accept_review(review_request, response, db)
+        
         # Generate AI responses (server-side)
-        user_response, summary, recommended_actions = ai_service.process_review(
-            review_request.name,
-            review_request.rating,
-            review_request.review_text
-        )
+        with metrics.timed("analyze"):
+            user_response, summary, recommended_actions, severity = ai_service.analyze_review(
+                review_request.name,
+                review_request.rating,
+                review_request.review_text
+            )
         
         # Create review record
         review_id = str(uuid.uuid4())
+        created_at = datetime.utcnow()
         db_review = Review(
             id=review_id,
+            customer_name=review_request.name,
             rating=review_request.rating,
             review_text=review_request.review_text,
             summary=summary,
             recommended_actions=recommended_actions,
             user_response=user_response,
-            created_at=datetime.utcnow()
+            status=STATUS_COMPLETED,
+            created_at=created_at,
+            **priority.score_fields(review_request.rating, review_request.review_text, created_at, severity)
         )
         
-        # Save to database
+        # Save to database, updating the analytics rollups in the same transaction
         db.add(db_review)
-        db.commit()
-        db.refresh(db_review)
+        rollups.record_review(db, db_review.rating, db_review.created_at)
+        with metrics.timed("db_commit"):
+            db.commit()
+        with metrics.timed("db_refresh"):
+            db.refresh(db_review)
+        events.publish_review_created(db_review)
         
         logger.info(f"Review saved successfully: id={review_id}")
         
@@ -118,24 +236,162 @@ def submit_review(
         raise HTTPException(status_code=500, detail=f"Failed to submit review: {str(e)}")
 
 
+def _accept_review(review_request: ReviewSubmitRequest, response: Response, db: Session) -> ReviewSubmitResponse:
+    """Store the review without AI fields and hand it to the background enrichment queue"""
+    review_id = str(uuid.uuid4())
+    created_at = datetime.utcnow()
+    # Scored from rating and keywords now; enrichment rescores once the LLM severity is known
+    db_review = Review(
+        id=review_id,
+        customer_name=review_request.name,
+        rating=review_request.rating,
+        review_text=review_request.review_text,
+        status=STATUS_PENDING,
+        created_at=created_at,
+        **priority.score_fields(review_request.rating, review_request.review_text, created_at)
+    )
+    
+    db.add(db_review)
+    rollups.record_review(db, db_review.rating, db_review.created_at)
+    with metrics.timed("db_commit"):
+        db.commit()
+    with metrics.timed("db_refresh"):
+        db.refresh(db_review)
+    events.publish_review_created(db_review)
+    
+    enrichment_queue.enqueue(review_id)
+    logger.info(f"Review accepted for enrichment: id={review_id}")
+    
+    response.status_code = 202
+    return ReviewSubmitResponse(
+        id=db_review.id,
+        rating=db_review.rating,
+        review_text=db_review.review_text,
+        user_response=None,
+        created_at=db_review.created_at,
+        status=STATUS_PENDING
+    )
+
+
+# Batch submit endpoint (Ingest)
+@app.post("/api/reviews/batch", response_model=ReviewBatchResponse, responses={202: {"model": ReviewBatchResponse}, 413: {"model": ErrorResponse}, 500: {"model": ErrorResponse}})
+def submit_reviews_batch(
+    response: Response,
+    items: List[Any] = Body(..., description="Array of review submissions (same fields as POST /api/reviews)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Submit many reviews in one request (Ingest endpoint)
+    
+    Each item is validated on its own, so one bad item does not reject the batch.
+    Valid items are enriched with bounded concurrency and inserted with one bulk
+    statement per chunk. With async enrichment enabled they are stored as pending
+    and the response is 202.
+    
+    Returns per-item results in submission order
+    """
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(items)} items (max {BATCH_MAX_ITEMS})")
+    
+    logger.info(f"Received batch submission: {len(items)} items")
+    results: List[Optional[BatchItemResult]] = [None] * len(items)
+    
+    # Validate everything up front
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, ReviewSubmitRequest.model_validate(item)))
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" if err['loc'] else err['msg']
+                for err in e.errors()
+            )
+            results[index] = BatchItemResult(index=index, status="error", error=detail)
+    
+    status = STATUS_PENDING if ASYNC_ENRICHMENT else STATUS_COMPLETED
+    for chunk in chunked(valid, INGEST_CHUNK_SIZE):
+        rows = [build_review_row(req.name, req.rating, req.review_text, status=status) for _, req in chunk]
+        errors = [None] * len(rows) if ASYNC_ENRICHMENT else enrich_rows(rows)
+        
+        to_insert = []
+        for (index, _), row, error in zip(chunk, rows, errors):
+            if error:
+                results[index] = BatchItemResult(index=index, status="error", error=f"AI processing failed: {error}")
+            else:
+                to_insert.append((index, row))
+        
+        try:
+            insert_reviews(db, [row for _, row in to_insert])
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error inserting batch chunk: {str(e)}")
+            db.rollback()
+            for index, _ in to_insert:
+                results[index] = BatchItemResult(index=index, status="error", error=f"Failed to save review: {str(e)}")
+            continue
+        
+        for index, row in to_insert:
+            events.publish_review_created(row)
+            if ASYNC_ENRICHMENT:
+                enrichment_queue.enqueue(row["id"])
+            results[index] = BatchItemResult(
+                index=index,
+                status="pending" if ASYNC_ENRICHMENT else "success",
+                id=row["id"],
+                user_response=row["user_response"]
+            )
+    
+    failed = sum(1 for result in results if result.status == "error")
+    logger.info(f"Batch processed: {len(items) - failed} saved, {failed} failed")
+    
+    if ASYNC_ENRICHMENT and failed < len(items):
+        response.status_code = 202
+    return ReviewBatchResponse(
+        total=len(items),
+        succeeded=len(items) - failed,
+        failed=failed,
+        results=results
+    )
+
+
 # Get all reviews endpoint (Admin-facing)
 @app.get("/api/reviews", response_model=AdminReviewsResponse)
 def get_reviews(
+    request: Request,
+    response: Response,
     rating: int = Query(None, ge=1, le=5, description="Filter by rating"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    cursor: str = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    include_total: bool = Query(True, description="Include the total review count"),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all reviews (Admin-facing endpoint)
     
     - **rating**: Optional filter by star rating
-    - **page**: Page number (default: 1)
+    - **page**: Page number (default: 1), ignored when a cursor is given
     - **page_size**: Items per page (default: 50, max: 100)
+    - **cursor**: Keyset cursor; every page costs the same regardless of depth
+    - **include_total**: Set to false to skip the total count
     
-    Returns list of reviews with AI-generated summaries and recommended actions
+    Returns list of reviews with AI-generated summaries and recommended actions.
+    Send the ETag back in If-None-Match to get 304 when nothing has changed.
     """
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
     try:
+        # Revalidation costs one primary-key read; unchanged data skips the query and serialization
+        version, last_modified = rollups.read_version(db)
+        etag = http_cache.make_etag("reviews", version)
+        if http_cache.is_not_modified(request, etag, last_modified):
+            return http_cache.not_modified(etag, last_modified)
+        http_cache.set_cache_headers(response, etag, last_modified)
+        
         # Build query
         query = db.query(Review)
         
@@ -143,11 +399,21 @@ def get_reviews(
         if rating is not None:
             query = query.filter(Review.rating == rating)
         
-        # Get total count
-        total = query.count()
+        # Total count comes from the analytics rollups instead of counting rows
+        total = rollups.count_reviews(db, rating) if include_total else None
+        
+        # Apply pagination and ordering; one extra row tells us whether another page exists
+        query = newest_first(query)
+        if cursor is not None:
+            query = after_cursor(query, cursor)
+        else:
+            query = query.offset((page - 1) * page_size)
+        reviews = query.limit(page_size + 1).all()
         
-        # Apply pagination and ordering
-        reviews = query.order_by(desc(Review.created_at)).offset((page - 1) * page_size).limit(page_size).all()
+        next_cursor = None
+        if len(reviews) > page_size:
+            reviews = reviews[:page_size]
+            next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id)
         
         # Convert to response model
         review_items = [
@@ -158,6 +424,7 @@ def get_reviews(
                 summary=review.summary,
                 recommended_actions=review.recommended_actions,
                 user_response=review.user_response,
+                status=review.status,
                 created_at=review.created_at
             )
             for review in reviews
@@ -167,7 +434,8 @@ def get_reviews(
             reviews=review_items,
             total=total,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            next_cursor=next_cursor
         )
         
     except Exception as e:
@@ -176,9 +444,23 @@ def get_reviews(
 
 
 
+def _response_cache_key(db: Session, key: str) -> str:
+    """
+    Response cache key for a read on `db`
+    
+    Writes invalidate the cache when the primary commits, but a replica may apply them
+    later; keying by the data version the replica has applied keeps a body built from
+    a lagging replica from outliving the lag.
+    """
+    if not DATABASE_READ_URL:
+        return key
+    version, _ = rollups.read_version(db)
+    return f"{key}@{version}"
+
+
 # Analytics endpoint (Admin-facing)
 @app.get("/api/analytics", response_model=AnalyticsResponse)
-def get_analytics(db: Session = Depends(get_db)):
+def get_analytics(request: Request, db: Session = Depends(get_read_db)):
     """
     Get analytics and statistics (Admin-facing endpoint)
     
@@ -187,30 +469,27 @@ def get_analytics(db: Session = Depends(get_db)):
     - Average rating
     - Rating distribution
     - Recent reviews count (last 24 hours)
+    
+    Supports If-None-Match; the ETag also rolls over every ANALYTICS_ETAG_SECONDS
+    because the last-24h count changes as reviews age out of the window
     """
     try:
-        # Total reviews
-        total_reviews = db.query(Review).count()
-        
-        # Average rating
-        avg_rating = db.query(func.avg(Review.rating)).scalar() or 0.0
-        
-        # Rating distribution
-        rating_distribution = {}
-        for rating in range(1, 6):
-            count = db.query(Review).filter(Review.rating == rating).count()
-            rating_distribution[rating] = count
-        
-        # Recent reviews (last 24 hours)
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_count = db.query(Review).filter(Review.created_at >= yesterday).count()
+        # Served from the response cache until the next committed write
+        cache_key = _response_cache_key(db, "analytics")
+        cached, generation = response_cache.lookup(cache_key)
+        if cached is None:
+            version, last_modified = rollups.read_version(db)
+            window = http_cache.time_window()
+            etag = http_cache.make_etag("analytics", version, window)
+            last_modified = max(filter(None, (last_modified, http_cache.window_start(window))))
+            if http_cache.is_not_modified(request, etag, last_modified):
+                return http_cache.not_modified(etag, last_modified)
+            
+            # Read the incrementally maintained rollups instead of scanning reviews
+            analytics = AnalyticsResponse(**rollups.read_analytics(db))
+            cached = response_cache.store(cache_key, generation, analytics.model_dump_json().encode(), etag, last_modified)
         
-        return AnalyticsResponse(
-            total_reviews=total_reviews,
-            average_rating=round(avg_rating, 2),
-            rating_distribution=rating_distribution,
-            recent_reviews_count=recent_count
-        )
+        return http_cache.cached_response(request, cached)
         
     except Exception as e:
         logger.error(f"Error fetching analytics: {str(e)}")
@@ -220,127 +499,190 @@ def get_analytics(db: Session = Depends(get_db)):
 # Priority reviews endpoint (Admin-facing) - MUST come before /{review_id}
 @app.get("/api/reviews/priority", response_model=PriorityReviewsResponse)
 def get_priority_reviews(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="Maximum number of urgent reviews to return"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
-    Get priority/urgent reviews (1-2 star ratings) (Admin-facing endpoint)
+    Get priority/urgent reviews (Admin-facing endpoint)
     
     - **limit**: Maximum number of urgent reviews to return (default: 20, max: 100)
     
-    Returns reviews that need immediate attention, sorted by most recent first
+    Returns the most urgent reviews first. Urgency combines rating, LLM severity and
+    risk keywords (refund, safety, legal) and decays with age, which only reorders
+    the list unless PRIORITY_URGENT_THRESHOLD is set.
     """
     try:
-        # Query for 1-2 star reviews
-        urgent_reviews = db.query(Review).filter(
-            Review.rating.in_([1, 2])
-        ).order_by(desc(Review.created_at)).limit(limit).all()
+        # Urgencies decay slowly, so a body may be reused for RESPONSE_CACHE_TTL_SECONDS unless a write lands
+        cache_key = _response_cache_key(db, f"priority:{limit}")
+        cached, generation = response_cache.lookup(cache_key)
+        if cached is not None:
+            return http_cache.cached_response(request, cached)
         
-        total_urgent = db.query(Review).filter(Review.rating.in_([1, 2])).count()
+        now = datetime.utcnow()
+        # The stored rank orders reviews by decayed urgency, so both queries are index range reads
+        rank_floor = priority.urgent_rank_floor(now)
+        urgent = db.query(Review).filter(
+            Review.priority_rank >= rank_floor if rank_floor is not None else Review.priority_rank.isnot(None)
+        )
+        
+        urgent_reviews = urgent.order_by(desc(Review.priority_rank)).limit(limit).all()
+        total_urgent = urgent.with_entities(func.count()).scalar()
         
         # Convert to response model
         review_items = [
-            AdminReviewItem(
+            PriorityReviewItem(
                 id=review.id,
                 rating=review.rating,
                 review_text=review.review_text,
                 summary=review.summary,
                 recommended_actions=review.recommended_actions,
                 user_response=review.user_response,
-                created_at=review.created_at
+                status=review.status,
+                created_at=review.created_at,
+                severity=review.severity,
+                urgency=round(priority.current_urgency(review.priority_rank, now), 2)
             )
             for review in urgent_reviews
         ]
         
-        return PriorityReviewsResponse(
+        priority_response = PriorityReviewsResponse(
             urgent_reviews=review_items,
             total_urgent=total_urgent,
             message=f"Found {total_urgent} reviews requiring immediate attention"
         )
+        cached = response_cache.store(cache_key, generation, priority_response.model_dump_json().encode())
+        return http_cache.cached_response(request, cached)
         
     except Exception as e:
         logger.error(f"Error fetching priority reviews: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch priority reviews: {str(e)}")
 
 
-# Export reviews to CSV endpoint (Admin-facing) - MUST come before /{review_id}
-@app.get("/api/reviews/export")
-def export_reviews(
+# Full-text search endpoint (Admin-facing) - MUST come before /{review_id}
+@app.get("/api/reviews/search", response_model=ReviewSearchResponse)
+def search_reviews(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for in review text and summary"),
     rating: int = Query(None, ge=1, le=5, description="Filter by rating"),
-    db: Session = Depends(get_db)
+    created_after: datetime = Query(None, description="Only reviews created at or after this time"),
+    created_before: datetime = Query(None, description="Only reviews created before this time"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(True, description="Include the total match count"),
+    db: Session = Depends(get_read_db)
 ):
     """
-    Export reviews to CSV (Admin-facing endpoint)
+    Search reviews by text (Admin-facing endpoint)
     
-    - **rating**: Optional filter by star rating
+    - **q**: Words that must all appear (stemmed; append * for prefix matches on SQLite)
+    - **rating**, **created_after**, **created_before**: Optional filters
+    - **page** / **page_size**: Pagination over the ranked results
     
-    Returns a CSV file with all reviews
+    Returns reviews ranked by relevance, best match first
     """
+    if not search.is_supported(db):
+        raise HTTPException(status_code=501, detail="Full-text search requires SQLite or PostgreSQL")
+    if not search.is_searchable(q):
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    
     try:
-        # Build query
-        query = db.query(Review)
-        
-        # Apply rating filter if provided
-        if rating is not None:
-            query = query.filter(Review.rating == rating)
-        
-        # Get all reviews
-        reviews = query.order_by(desc(Review.created_at)).all()
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'ID',
-            'Rating',
-            'Review Text',
-            'Summary',
-            'Recommended Actions',
-            'User Response',
-            'Created At'
-        ])
-        
-        # Write data
-        for review in reviews:
-            writer.writerow([
-                review.id,
-                review.rating,
-                review.review_text,
-                review.summary or '',
-                ', '.join(review.recommended_actions) if review.recommended_actions else '',
-                review.user_response or '',
-                review.created_at.isoformat()
-            ])
-        
-        # Prepare response
-        output.seek(0)
+        results, total = search.search_reviews(
+            db,
+            q,
+            rating=rating,
+            created_after=created_after,
+            created_before=created_before,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            include_total=include_total
+        )
         
-        # Generate filename with timestamp
-        filename = f"reviews_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+        review_items = [
+            ReviewSearchItem(
+                id=review.id,
+                rating=review.rating,
+                review_text=review.review_text,
+                summary=review.summary,
+                recommended_actions=review.recommended_actions,
+                user_response=review.user_response,
+                status=review.status,
+                created_at=review.created_at,
+                score=score
+            )
+            for review, score in results
+        ]
         
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return ReviewSearchResponse(
+            query=q,
+            reviews=review_items,
+            total=total,
+            page=page,
+            page_size=page_size
         )
         
     except Exception as e:
-        logger.error(f"Error exporting reviews: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to export reviews: {str(e)}")
+        logger.error(f"Error searching reviews: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search reviews: {str(e)}")
+
+
+# Export reviews to CSV endpoint (Admin-facing) - MUST come before /{review_id}
+@app.get("/api/reviews/export")
+def export_reviews(
+    rating: int = Query(None, ge=1, le=5, description="Filter by rating"),
+    format: str = Query("csv", description="Export format: csv, ndjson, parquet or arrow"),
+    columns: str = Query(None, description="Comma-separated columns to include (default: all)"),
+    compression: str = Query("none", description="csv/ndjson: gzip; parquet: snappy, gzip, zstd; arrow: lz4, zstd")
+):
+    """
+    Export reviews (Admin-facing endpoint)
+    
+    - **rating**: Optional filter by star rating
+    - **format**: csv (default), ndjson, parquet or arrow (IPC stream)
+    - **columns**: Optional column projection, e.g. `id,rating,created_at`
+    - **compression**: Optional codec for the chosen format
+    
+    Returns a file with all matching reviews, streamed in batches as rows are read
+    """
+    try:
+        chunks, media_type, extension = build_export(format, columns, compression, rating)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    
+    # Generate filename with timestamp
+    filename = f"reviews_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 
 # Get single review endpoint - MUST come AFTER /priority and /export
 @app.get("/api/reviews/{review_id}", response_model=AdminReviewItem)
-def get_review(review_id: str, db: Session = Depends(get_db)):
+def get_review(review_id: str, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """
     Get a single review by ID
     
     - **review_id**: UUID of the review
+    
+    Supports If-None-Match / If-Modified-Since (304 when nothing has changed)
     """
+    version, last_modified = rollups.read_version(db)
+    etag = http_cache.make_etag("review", version)
+    if http_cache.is_not_modified(request, etag, last_modified):
+        return http_cache.not_modified(etag, last_modified)
+    http_cache.set_cache_headers(response, etag, last_modified)
+    
     review = db.query(Review).filter(Review.id == review_id).first()
     
+    # A review submitted moments ago may not have reached the replica yet
+    if not review and DATABASE_READ_URL and READ_YOUR_WRITES_FALLBACK:
+        with SessionLocal() as primary:
+            review = primary.query(Review).filter(Review.id == review_id).first()
+    
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     
@@ -351,10 +693,39 @@ def get_review(review_id: str, db: Session = Depends(get_db)):
         summary=review.summary,
         recommended_actions=review.recommended_actions,
         user_response=review.user_response,
+        status=review.status,
         created_at=review.created_at
     )
 
 
+# Enrichment status endpoint (User-facing)
+@app.get("/api/reviews/{review_id}/status", response_model=ReviewStatusResponse)
+def get_review_status(review_id: str, db: Session = Depends(get_db)):
+    """
+    Get the enrichment status of a submitted review
+    
+    - **review_id**: UUID of the review
+    
+    Returns the AI-generated user response once status is "completed"
+    """
+    # Polled right after a submit, so this stays on the primary rather than the replica
+    row = db.query(Review.id, Review.status, Review.user_response).filter(Review.id == review_id).first()
+    
+    if not row:
+        raise HTTPException(status_code=404, detail="Review not found")
+    
+    return ReviewStatusResponse(
+        id=row.id,
+        status=row.status,
+        user_response=row.user_response
+    )
+
+
+# Async endpoints replace their sync counterparts when ASYNC_API=true
+if ASYNC_API:
+    import async_api
+    async_api.install(app)
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,241 @@
+"""
+Prometheus metrics for GET /metrics
+Request latency per route template comes from MetricsMiddleware; the stages of a
+submission (LLM calls, the whole AI step, commit, refresh) are timed with
+timed(). Counters that already exist elsewhere (LLM calls, retries,
+fallbacks, tokens, caches, connection pools) are read at scrape time, so the
+hot path only pays for one histogram observation per request and stage.
+"""
+
+import os
+import time
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Record request and stage timings and serve /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans cached reads (~1ms) to slow Groq calls with retries
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Route label for requests that matched no route (404s), so scanners cannot explode cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _header(name: str, kind: str, documentation: str) -> List[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+
+
+class Counter:
+    """Monotonic counter with a fixed set of labels"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = _header(self.name, "counter", self.documentation)
+        lines += [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in values]
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram with a fixed set of labels"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((key, list(counts), total) for key, (counts, total) in self._series.items())
+        lines = _header(self.name, "histogram", self.documentation)
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+def _family(name: str, kind: str, documentation: str, labelnames: Sequence[str],
+            samples: Iterable[Tuple[tuple, float]]) -> List[str]:
+    """Render a metric whose values are read at scrape time"""
+    lines = _header(name, kind, documentation)
+    lines += [f"{name}{_labels(labelnames, key)} {_number(value)}" for key, value in samples]
+    return lines
+
+
+http_requests = Counter(
+    "review_http_requests_total", "HTTP requests by route template and status code",
+    ("method", "route", "status")
+)
+http_request_duration = Histogram(
+    "review_http_request_duration_seconds", "Time from receiving a request to sending the last byte",
+    ("method", "route")
+)
+stage_duration = Histogram(
+    "review_stage_duration_seconds", "Time spent in one stage of a request (llm_call, analyze, db_commit, db_refresh)",
+    ("stage",)
+)
+
+
+class StageTimer:
+    """Context manager adding the wall time of a block to stage_duration; works around awaits"""
+
+    __slots__ = ("stage", "_start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if METRICS_ENABLED:
+            stage_duration.observe(time.perf_counter() - self._start, self.stage)
+        return False
+
+
+def timed(stage: str) -> StageTimer:
+    """with metrics.timed("db_commit"): db.commit()"""
+    return StageTimer(stage)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request count and latency per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the scope; its path is the template (/api/reviews/{review_id})
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_request_duration.observe(time.perf_counter() - start, scope["method"], route)
+            http_requests.inc(scope["method"], route, str(status))
+
+
+def _pool_samples(engines: Dict[str, object]):
+    """(engine, state) -> connections for every engine with a QueuePool"""
+    sizes, connections = [], []
+    for name, db_engine in engines.items():
+        pool = getattr(db_engine, "pool", None)
+        if pool is None or not hasattr(pool, "checkedout"):
+            # SingletonThreadPool / StaticPool (in-memory SQLite) keep no counters
+            continue
+        sizes.append(((name,), pool.size()))
+        connections.append(((name, "checked_out"), pool.checkedout()))
+        connections.append(((name, "idle"), pool.checkedin()))
+        connections.append(((name, "overflow"), max(pool.overflow(), 0)))
+    return sizes, connections
+
+
+def render(ai_stats: dict, engines: Dict[str, object], response_cache_stats: Optional[dict] = None) -> str:
+    """Prometheus text exposition of every metric"""
+    lines = []
+    for metric in (http_requests, http_request_duration, stage_duration):
+        lines += metric.render()
+
+    counters = ai_stats.get("llm_calls", {})
+    lines += _family(
+        "review_llm_events_total", "counter",
+        "LLM attempts, failures, retries, rate limits, short-circuited calls and outputs served from fallbacks",
+        ("event",),
+        [((event,), value) for event, value in sorted(counters.items()) if not event.endswith("_tokens")]
+    )
+    lines += _family(
+        "review_llm_tokens_total", "counter", "Tokens reported by the LLM backend", ("kind",),
+        [(("prompt",), counters.get("prompt_tokens", 0)), (("completion",), counters.get("completion_tokens", 0))]
+    )
+
+    breaker = ai_stats.get("circuit_breaker", {})
+    lines += _family(
+        "review_llm_circuit_open", "gauge", "1 while the LLM circuit breaker rejects calls", (),
+        [((), 1 if breaker.get("state") == "open" else 0)]
+    )
+    lines += _family(
+        "review_llm_circuit_opened_total", "counter", "Times the LLM circuit breaker opened", (),
+        [((), breaker.get("times_opened", 0))]
+    )
+
+    cache_samples = []
+    for cache, stats in (("llm", ai_stats.get("cache", {})), ("response", response_cache_stats or {})):
+        if not stats.get("enabled"):
+            continue
+        cache_samples.append(((cache, "hit"), stats.get("hits", 0)))
+        cache_samples.append(((cache, "shared_hit"), stats.get("persistent_hits", stats.get("shared_hits", 0))))
+        cache_samples.append(((cache, "miss"), stats.get("misses", 0)))
+    lines += _family(
+        "review_cache_lookups_total", "counter", "Cache lookups by cache and result", ("cache", "result"), cache_samples
+    )
+
+    sizes, connections = _pool_samples(engines)
+    lines += _family("review_db_pool_size", "gauge", "Configured connection pool size", ("engine",), sizes)
+    lines += _family(
+        "review_db_pool_connections", "gauge", "Pooled connections by state", ("engine", "state"), connections
+    )
+    return "\n".join(lines) + "\n"
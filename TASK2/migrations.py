@@ -0,0 +1,292 @@
+"""
+Versioned schema migrations for the review database
+Each migration runs once, in order, and is recorded in the schema_migrations table.
+Migrations are written to be safe on databases created by the old
+Base.metadata.create_all() bootstrap, which may already contain some objects.
+
+Usage: python migrations.py [upgrade|status]
+"""
+
+import sys
+import logging
+from datetime import datetime
+
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, Text, DateTime, JSON,
+    inspect, text, select
+)
+from sqlalchemy.engine import Connection, Engine
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Arbitrary key for the Postgres advisory lock that serializes concurrent upgrades
+MIGRATION_LOCK_ID = 7346110
+
+schema_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations", schema_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime, nullable=False)
+)
+
+# Frozen table definitions as they were introduced; later changes are separate migrations
+reviews_v1 = Table(
+    "reviews", MetaData(),
+    Column("id", String, primary_key=True, index=True),
+    Column("rating", Integer, nullable=False),
+    Column("review_text", Text, nullable=False),
+    Column("summary", Text, nullable=True),
+    Column("recommended_actions", JSON, nullable=True),
+    Column("user_response", Text, nullable=True),
+    Column("created_at", DateTime, index=True),
+    Column("updated_at", DateTime)
+)
+
+rollups_v3 = MetaData()
+Table(
+    "review_rating_rollups", rollups_v3,
+    Column("rating", Integer, primary_key=True),
+    Column("review_count", Integer, nullable=False, default=0),
+    Column("rating_sum", Integer, nullable=False, default=0)
+)
+Table(
+    "review_time_buckets", rollups_v3,
+    Column("granularity", String(10), primary_key=True),
+    Column("bucket_start", DateTime, primary_key=True),
+    Column("review_count", Integer, nullable=False, default=0),
+    Column("rating_sum", Integer, nullable=False, default=0)
+)
+
+data_versions_v7 = Table(
+    "data_versions", MetaData(),
+    Column("name", String(50), primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+    Column("updated_at", DateTime, nullable=False)
+)
+
+
+def _columns(conn: Connection, table: str) -> set:
+    return {column["name"] for column in inspect(conn).get_columns(table)}
+
+
+def _indexes(conn: Connection, table: str) -> set:
+    return {index["name"] for index in inspect(conn).get_indexes(table)}
+
+
+def _create_index(conn: Connection, name: str, definition: str):
+    """Create a reviews index from literal DDL (never from the live model), skipping it if it exists"""
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON reviews {definition}"))
+
+
+def migration_001_baseline(conn: Connection):
+    """Original reviews table"""
+    reviews_v1.create(conn, checkfirst=True)
+
+
+def migration_002_review_status(conn: Connection):
+    """customer_name and status columns for asynchronous enrichment"""
+    columns = _columns(conn, "reviews")
+    if "customer_name" not in columns:
+        conn.execute(text("ALTER TABLE reviews ADD COLUMN customer_name VARCHAR(50)"))
+    if "status" not in columns:
+        conn.execute(text("ALTER TABLE reviews ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'completed'"))
+    _create_index(conn, "ix_reviews_status", "(status)")
+
+
+def migration_003_analytics_rollups(conn: Connection):
+    """Rollup tables backing /api/analytics, backfilled from the existing reviews"""
+    rollups_v3.create_all(conn, checkfirst=True)
+    rating_rollups = rollups_v3.tables["review_rating_rollups"]
+    time_buckets = rollups_v3.tables["review_time_buckets"]
+    
+    # Recomputed from scratch in this transaction, so rows from an older bootstrap are replaced
+    conn.execute(rating_rollups.delete())
+    conn.execute(time_buckets.delete())
+    
+    by_rating = {rating: [0, 0] for rating in range(1, 6)}
+    by_bucket = {}
+    last_id = ""
+    while True:
+        rows = conn.execute(text(
+            "SELECT id, rating, created_at FROM reviews WHERE id > :last_id ORDER BY id LIMIT 1000"
+        ), {"last_id": last_id}).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            totals = by_rating.setdefault(row.rating, [0, 0])
+            totals[0] += 1
+            totals[1] += row.rating
+            created_at = row.created_at
+            if created_at is None:
+                continue
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+            hour = created_at.replace(minute=0, second=0, microsecond=0)
+            for key in (("hour", hour), ("day", hour.replace(hour=0))):
+                totals = by_bucket.setdefault(key, [0, 0])
+                totals[0] += 1
+                totals[1] += row.rating
+        last_id = rows[-1].id
+    
+    conn.execute(rating_rollups.insert(), [
+        {"rating": rating, "review_count": count, "rating_sum": rating_sum}
+        for rating, (count, rating_sum) in by_rating.items()
+    ])
+    if by_bucket:
+        conn.execute(time_buckets.insert(), [
+            {"granularity": granularity, "bucket_start": bucket_start, "review_count": count, "rating_sum": rating_sum}
+            for (granularity, bucket_start), (count, rating_sum) in by_bucket.items()
+        ])
+
+
+def migration_004_review_indexes(conn: Connection):
+    """Composite listing/filter indexes and the partial priority index"""
+    _create_index(conn, "ix_reviews_created_at_id", "(created_at DESC, id DESC)")
+    _create_index(conn, "ix_reviews_rating_created_at", "(rating, created_at DESC, id DESC)")
+    _create_index(conn, "ix_reviews_priority", "(created_at DESC) WHERE rating IN (1, 2)")
+
+
+def migration_005_review_search(conn: Connection):
+    """Full-text index over review_text and summary (FTS5 on SQLite, tsvector/GIN on Postgres)"""
+    if conn.dialect.name == "postgresql":
+        # A generated column stays in sync with every insert and update without triggers
+        if "search_vector" not in _columns(conn, "reviews"):
+            conn.execute(text(
+                "ALTER TABLE reviews ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('english', coalesce(review_text, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(summary, '')), 'B')) STORED"
+            ))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_reviews_search ON reviews USING GIN (search_vector)"))
+        return
+    
+    if conn.dialect.name != "sqlite":
+        logger.warning(f"Full-text search is not supported on {conn.dialect.name}; skipping")
+        return
+    
+    # External-content FTS5 table keyed by the reviews rowid, so text is not stored twice
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5("
+        "review_text, summary, content='reviews', content_rowid='rowid', tokenize='porter unicode61')"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_ai AFTER INSERT ON reviews BEGIN "
+        "INSERT INTO reviews_fts(rowid, review_text, summary) VALUES (new.rowid, new.review_text, new.summary); "
+        "END"
+    ))
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_ad AFTER DELETE ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, review_text, summary) VALUES ('delete', old.rowid, old.review_text, old.summary); "
+        "END"
+    ))
+    # Enrichment fills in the summary after the insert
+    conn.execute(text(
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_au AFTER UPDATE OF review_text, summary ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, review_text, summary) VALUES ('delete', old.rowid, old.review_text, old.summary); "
+        "INSERT INTO reviews_fts(rowid, review_text, summary) VALUES (new.rowid, new.review_text, new.summary); "
+        "END"
+    ))
+    conn.execute(text("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')"))
+
+
+def migration_006_priority_scores(conn: Connection):
+    """severity/urgency_score/priority_rank columns, backfilled, replacing the 1-2 star partial index"""
+    import priority
+    
+    columns = _columns(conn, "reviews")
+    for name, column_type in (("severity", "INTEGER"), ("urgency_score", "FLOAT"), ("priority_rank", "FLOAT")):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE reviews ADD COLUMN {name} {column_type}"))
+    
+    # Existing rows have no LLM severity, so they get the rating default; keyset batches bound memory
+    last_id = ""
+    while True:
+        rows = conn.execute(text(
+            "SELECT id, rating, review_text, created_at FROM reviews "
+            "WHERE id > :last_id AND priority_rank IS NULL ORDER BY id LIMIT 1000"
+        ), {"last_id": last_id}).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            created_at = row.created_at
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+            fields = priority.score_fields(row.rating, row.review_text, created_at or datetime.utcnow())
+            updates.append({"id": row.id, "urgency_score": fields["urgency_score"], "priority_rank": fields["priority_rank"]})
+        conn.execute(text(
+            "UPDATE reviews SET urgency_score = :urgency_score, priority_rank = :priority_rank WHERE id = :id"
+        ), updates)
+        last_id = rows[-1].id
+    
+    conn.execute(text("DROP INDEX IF EXISTS ix_reviews_priority"))
+    _create_index(conn, "ix_reviews_priority_rank", "(priority_rank DESC)")
+
+
+def migration_007_data_versions(conn: Connection):
+    """Change counter behind the ETags of the admin read endpoints"""
+    data_versions_v7.create(conn, checkfirst=True)
+    exists = conn.execute(
+        select(data_versions_v7.c.name).where(data_versions_v7.c.name == "reviews")
+    ).first()
+    if not exists:
+        conn.execute(data_versions_v7.insert().values(name="reviews", version=0, updated_at=datetime.utcnow()))
+
+
+MIGRATIONS = [
+    (1, "baseline", migration_001_baseline),
+    (2, "review_status", migration_002_review_status),
+    (3, "analytics_rollups", migration_003_analytics_rollups),
+    (4, "review_indexes", migration_004_review_indexes),
+    (5, "review_search", migration_005_review_search),
+    (6, "priority_scores", migration_006_priority_scores),
+    (7, "data_versions", migration_007_data_versions),
+]
+
+
+def applied_versions(conn: Connection) -> set:
+    schema_migrations.create(conn, checkfirst=True)
+    return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def run_migrations(engine: Engine) -> int:
+    """Apply pending migrations in order; returns how many were applied"""
+    applied = 0
+    for version, name, migrate in MIGRATIONS:
+        with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # Other workers starting at the same time wait here, then see the migration as applied
+                conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+            if version in applied_versions(conn):
+                continue
+            
+            logger.info(f"Applying migration {version:03d}_{name}")
+            migrate(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()
+            ))
+            applied += 1
+    return applied
+
+
+def migration_status(engine: Engine):
+    with engine.begin() as conn:
+        done = applied_versions(conn)
+    for version, name, _ in MIGRATIONS:
+        print(f"{version:03d}_{name}: {'applied' if version in done else 'pending'}")
+
+
+if __name__ == "__main__":
+    from database import engine
+    
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "upgrade":
+        count = run_migrations(engine)
+        print(f"Applied {count} migration(s)")
+    elif command == "status":
+        migration_status(engine)
+    else:
+        sys.exit("Usage: python migrations.py [upgrade|status]")
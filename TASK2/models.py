@@ -26,7 +26,7 @@ class ReviewSubmitResponse(BaseModel):
     id: str
     rating: int
     review_text: str
-    user_response: str
+    user_response: Optional[str] = None  # None while enrichment is pending
     created_at: datetime
     status: str = "success"
     
@@ -34,6 +34,23 @@ class ReviewSubmitResponse(BaseModel):
         from_attributes = True
 
 
+class BatchItemResult(BaseModel):
+    """Outcome of one item in a batch submission"""
+    index: int  # Position in the submitted array
+    status: str  # success, pending or error
+    id: Optional[str] = None
+    user_response: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ReviewBatchResponse(BaseModel):
+    """Response model after submitting a batch of reviews"""
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult]
+
+
 class AdminReviewItem(BaseModel):
     """Single review item for admin dashboard"""
     id: str
@@ -42,16 +59,39 @@ class AdminReviewItem(BaseModel):
     summary: Optional[str] = None
     recommended_actions: Optional[List[str]] = None
     user_response: Optional[str] = None
+    status: Optional[str] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class ReviewStatusResponse(BaseModel):
+    """Enrichment status of a submitted review"""
+    id: str
+    status: str  # pending, processing, completed, failed
+    user_response: Optional[str] = None
+
+
 class AdminReviewsResponse(BaseModel):
     """Response model for admin reviews list"""
     reviews: List[AdminReviewItem]
-    total: int
+    total: Optional[int] = None  # Omitted when include_total=false
+    page: int
+    page_size: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next page
+
+
+class ReviewSearchItem(AdminReviewItem):
+    """Search hit with its relevance score (higher is better)"""
+    score: float
+
+
+class ReviewSearchResponse(BaseModel):
+    """Response model for full-text review search"""
+    query: str
+    reviews: List[ReviewSearchItem]
+    total: Optional[int] = None  # Omitted when include_total=false
     page: int
     page_size: int
 
@@ -64,13 +104,59 @@ class AnalyticsResponse(BaseModel):
     recent_reviews_count: int  # Last 24 hours
 
 
+class PriorityReviewItem(AdminReviewItem):
+    """Review in the priority queue with its current (decayed) urgency"""
+    severity: Optional[int] = None
+    urgency: float
+
+
 class PriorityReviewsResponse(BaseModel):
     """Response model for priority/urgent reviews"""
-    urgent_reviews: List[AdminReviewItem]
+    urgent_reviews: List[PriorityReviewItem]
     total_urgent: int
     message: str = "Reviews requiring immediate attention"
 
 
+# AI Models
+class ReviewInsights(BaseModel):
+    """Validated output of the fused single-call review analysis"""
+    user_response: str = Field(..., min_length=1)
+    summary: str = Field(..., min_length=1)
+    recommended_actions: List[str] = Field(..., min_length=1)
+    severity: Optional[int] = None
+    
+    @field_validator('user_response', 'summary')
+    @classmethod
+    def validate_text(cls, v: str) -> str:
+        """Reject fields that are only whitespace"""
+        if not v.strip():
+            raise ValueError("Field cannot be empty or just whitespace")
+        return v.strip()
+    
+    @field_validator('recommended_actions')
+    @classmethod
+    def validate_actions(cls, v: List[str]) -> List[str]:
+        """Strip numbering/markdown, drop blank actions and keep at most three"""
+        actions = [
+            action.strip().lstrip('0123456789.-•) ').replace('**', '').replace('__', '').strip()
+            for action in v
+        ]
+        actions = [action for action in actions if action]
+        if not actions:
+            raise ValueError("At least one recommended action is required")
+        return actions[:3]
+    
+    @field_validator('severity', mode='before')
+    @classmethod
+    def validate_severity(cls, v) -> Optional[int]:
+        """Keep a 1-5 severity; anything else counts as not assessed"""
+        try:
+            severity = int(v)
+        except (TypeError, ValueError):
+            return None
+        return severity if 1 <= severity <= 5 else None
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     error: str
@@ -0,0 +1,37 @@
+import json
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from sqlalchemy import desc, tuple_
+from sqlalchemy.orm import Query
+
+from database import Review
+
+
+def encode_cursor(created_at: datetime, review_id: str) -> str:
+    """Opaque token pointing just past the given review in (created_at, id) descending order"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": review_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed tokens"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), str(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def newest_first(query: Query) -> Query:
+    """Stable newest-first ordering; id breaks ties between reviews created at the same instant"""
+    return query.order_by(desc(Review.created_at), desc(Review.id))
+
+
+def after_cursor(query: Query, cursor: str) -> Query:
+    """Keyset filter: only reviews that sort after the cursor position"""
+    created_at, review_id = decode_cursor(cursor)
+    # Row-value comparison so the (created_at, id) index serves it as a range seek
+    return query.filter(tuple_(Review.created_at, Review.id) < tuple_(created_at, review_id))
@@ -0,0 +1,86 @@
+"""
+Urgency scoring for the admin priority queue
+Each review gets a base urgency score (rating, LLM severity, risk keywords) when
+it is stored. Age decay is folded into priority_rank = log2(score) + age_hours / half_life,
+so ordering by the stored rank equals ordering by the decayed score at any
+moment and rows never need rescoring as they get older.
+"""
+
+import os
+import re
+import math
+from datetime import datetime
+from typing import List, Optional
+
+# Hours for an unhandled review's urgency to halve
+PRIORITY_HALF_LIFE_HOURS = float(os.getenv("PRIORITY_HALF_LIFE_HOURS", "168"))
+# Decayed score a review needs to appear in /api/reviews/priority (0 lists every review).
+# Decay alone drops unhandled reviews below a positive threshold: at 40 with a 168h
+# half-life a plain 1-star review leaves the list after about 4 days, a 2-star after 2
+PRIORITY_URGENT_THRESHOLD = float(os.getenv("PRIORITY_URGENT_THRESHOLD", "0"))
+
+# Fixed origin for ranks; any constant works, a recent one keeps the floats small
+RANK_EPOCH = datetime(2020, 1, 1)
+
+MIN_SCORE = 1.0
+MAX_SCORE = 100.0
+
+RATING_POINTS = {1: 40, 2: 30, 3: 15, 4: 5, 5: 0}
+# Severity assumed when the LLM gave none (positive reviews, fallbacks, not yet enriched)
+DEFAULT_SEVERITY = {1: 3, 2: 3, 3: 2, 4: 1, 5: 1}
+POINTS_PER_SEVERITY = 10
+
+# Risk keywords: name -> (points, pattern)
+KEYWORD_GROUPS = {
+    "safety": (25, re.compile(
+        r"\b(food poisoning|poison\w*|sick|vomit\w*|injur\w*|allerg\w*|unsafe|dangerous|hazard\w*|"
+        r"mou?ld|cockroach\w*|rats?|pests?)\b", re.IGNORECASE)),
+    "legal": (20, re.compile(
+        r"\b(lawyers?|attorneys?|lawsuit|sue|suing|legal action|court|discriminat\w*|harass\w*)\b", re.IGNORECASE)),
+    "refund": (10, re.compile(
+        r"\b(refund\w*|chargeback|money back|overcharg\w*|double charged|charged twice|scam\w*|fraud\w*)\b", re.IGNORECASE)),
+}
+
+
+def keyword_flags(review_text: str) -> List[str]:
+    """Names of the risk keyword groups mentioned in the review"""
+    return [name for name, (_, pattern) in KEYWORD_GROUPS.items() if pattern.search(review_text or "")]
+
+
+def urgency_score(rating: int, review_text: str, severity: Optional[int] = None) -> float:
+    """Undecayed urgency between MIN_SCORE and MAX_SCORE"""
+    severity = severity or DEFAULT_SEVERITY.get(rating, 1)
+    score = RATING_POINTS.get(rating, 0) + (severity - 1) * POINTS_PER_SEVERITY
+    score += sum(KEYWORD_GROUPS[name][0] for name in keyword_flags(review_text))
+    return float(max(MIN_SCORE, min(MAX_SCORE, score)))
+
+
+def _hours(moment: datetime) -> float:
+    return (moment - RANK_EPOCH).total_seconds() / 3600
+
+
+def priority_rank(score: float, created_at: datetime) -> float:
+    """Decay-invariant sort key: newer reviews gain one unit per half-life"""
+    return math.log2(max(score, MIN_SCORE)) + _hours(created_at) / PRIORITY_HALF_LIFE_HOURS
+
+
+def current_urgency(rank: float, now: Optional[datetime] = None) -> float:
+    """Decayed score of a review with this rank at `now`"""
+    return 2 ** (rank - _hours(now or datetime.utcnow()) / PRIORITY_HALF_LIFE_HOURS)
+
+
+def urgent_rank_floor(now: Optional[datetime] = None, threshold: float = PRIORITY_URGENT_THRESHOLD) -> Optional[float]:
+    """Lowest rank whose decayed score is still above the threshold (None: no threshold)"""
+    if threshold <= 0:
+        return None
+    return priority_rank(threshold, now or datetime.utcnow())
+
+
+def score_fields(rating: int, review_text: str, created_at: datetime, severity: Optional[int] = None) -> dict:
+    """severity, urgency_score and priority_rank column values for one review"""
+    score = urgency_score(rating, review_text, severity)
+    return {
+        "severity": severity,
+        "urgency_score": score,
+        "priority_rank": priority_rank(score, created_at),
+    }
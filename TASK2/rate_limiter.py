@@ -0,0 +1,192 @@
+import os
+import time
+import asyncio
+import sqlite3
+import threading
+import logging
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Groq quota shared by every process using the same state file (API workers, TASK1 evaluation)
+GROQ_RATE_LIMIT_ENABLED = os.getenv("GROQ_RATE_LIMIT_ENABLED", "true").lower() == "true"
+GROQ_RPM_LIMIT = int(os.getenv("GROQ_RPM_LIMIT", "30"))
+GROQ_TPM_LIMIT = int(os.getenv("GROQ_TPM_LIMIT", "12000"))
+GROQ_RATE_LIMIT_DB = os.getenv(
+    "GROQ_RATE_LIMIT_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "groq_rate_limit.db")
+)
+
+# Rough completion size used when reserving tokens before a call
+EXPECTED_OUTPUT_TOKENS = 256
+
+
+def estimate_tokens(prompt: str, expected_output_tokens: int = EXPECTED_OUTPUT_TOKENS) -> int:
+    """Approximate prompt + completion tokens (~4 characters per token)"""
+    return len(prompt) // 4 + expected_output_tokens
+
+
+class TokenBucketLimiter:
+    """Request and token budgets refilled per minute, with state shared through a SQLite file"""
+    
+    def __init__(
+        self,
+        requests_per_minute: int = GROQ_RPM_LIMIT,
+        tokens_per_minute: int = GROQ_TPM_LIMIT,
+        state_path: str = GROQ_RATE_LIMIT_DB,
+        name: str = "groq"
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.state_path = state_path
+        self.name = name
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+        self._init_state()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode so transactions are controlled explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.state_path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+    
+    def _init_state(self):
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "name TEXT PRIMARY KEY, request_level REAL NOT NULL, "
+            "token_level REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO rate_limit_buckets (name, request_level, token_level, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            (self.name, self.requests_per_minute, self.tokens_per_minute, time.time())
+        )
+    
+    def _refill(self, request_level: float, token_level: float, elapsed: float):
+        request_level = min(self.requests_per_minute, request_level + elapsed * self.requests_per_minute / 60)
+        token_level = min(self.tokens_per_minute, token_level + elapsed * self.tokens_per_minute / 60)
+        return request_level, token_level
+    
+    def _try_acquire(self, tokens: int) -> float:
+        """Take one request and `tokens` tokens if available; otherwise return seconds to wait"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            request_level, token_level, updated_at = conn.execute(
+                "SELECT request_level, token_level, updated_at FROM rate_limit_buckets WHERE name = ?",
+                (self.name,)
+            ).fetchone()
+            now = time.time()
+            request_level, token_level = self._refill(request_level, token_level, max(now - updated_at, 0.0))
+            
+            if request_level >= 1 and token_level >= tokens:
+                request_level -= 1
+                token_level -= tokens
+                wait = 0.0
+            else:
+                request_wait = max(1 - request_level, 0) * 60 / self.requests_per_minute
+                token_wait = max(tokens - token_level, 0) * 60 / self.tokens_per_minute
+                wait = max(request_wait, token_wait, 0.01)
+            
+            conn.execute(
+                "UPDATE rate_limit_buckets SET request_level = ?, token_level = ?, updated_at = ? WHERE name = ?",
+                (request_level, token_level, now, self.name)
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def acquire(self, tokens: int, timeout: Optional[float] = None) -> bool:
+        """Block until the budget allows one more call; False if `timeout` seconds pass first"""
+        # A single call larger than the whole budget would never fit; let it through at full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        waited = 0.0
+        
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                self._record_acquired(waited)
+                return True
+            
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self._record_timeout(wait)
+                return False
+            
+            # Re-check at least once a second: other processes may return tokens via record_usage
+            time.sleep(min(wait, 1.0))
+            waited += min(wait, 1.0)
+    
+    async def acquire_async(self, tokens: int, timeout: Optional[float] = None) -> bool:
+        """Same as acquire(), but waits on the event loop instead of blocking a thread"""
+        tokens = min(tokens, self.tokens_per_minute)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        waited = 0.0
+        
+        while True:
+            # BEGIN IMMEDIATE can wait up to 30s on the shared file while another process holds it
+            wait = await asyncio.to_thread(self._try_acquire, tokens)
+            if wait == 0:
+                self._record_acquired(waited)
+                return True
+            
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self._record_timeout(wait)
+                return False
+            
+            await asyncio.sleep(min(wait, 1.0))
+            waited += min(wait, 1.0)
+    
+    def _record_acquired(self, waited: float):
+        with self._lock:
+            self._acquired += 1
+            if waited:
+                self._waited += 1
+                self._wait_seconds += waited
+    
+    def _record_timeout(self, wait: float):
+        with self._lock:
+            self._timeouts += 1
+        logger.warning(f"Rate limit wait of {wait:.1f}s exceeds timeout")
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """Correct the token bucket once the real usage of a call is known"""
+        difference = actual_tokens - min(estimated_tokens, self.tokens_per_minute)
+        if difference == 0:
+            return
+        conn = self._connect()
+        conn.execute(
+            "UPDATE rate_limit_buckets SET token_level = MIN(token_level - ?, ?) WHERE name = ?",
+            (difference, self.tokens_per_minute, self.name)
+        )
+    
+    async def record_usage_async(self, estimated_tokens: int, actual_tokens: int):
+        """record_usage() in a worker thread so the shared-file write never blocks the event loop"""
+        await asyncio.to_thread(self.record_usage, estimated_tokens, actual_tokens)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": True,
+                "requests_per_minute": self.requests_per_minute,
+                "tokens_per_minute": self.tokens_per_minute,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_seconds": round(self._wait_seconds, 3),
+                "timeouts": self._timeouts
+            }
+
+
+# Singleton instance (None when rate limiting is disabled)
+groq_rate_limiter = TokenBucketLimiter() if GROQ_RATE_LIMIT_ENABLED else None
@@ -0,0 +1,171 @@
+import os
+import time
+import random
+import threading
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Retry configuration
+AI_MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "2"))
+AI_RETRY_BASE_DELAY = float(os.getenv("AI_RETRY_BASE_DELAY", "0.5"))
+AI_RETRY_MAX_DELAY = float(os.getenv("AI_RETRY_MAX_DELAY", "8"))
+# Total time one LLM call may spend sleeping between retries
+AI_RETRY_BUDGET_SECONDS = float(os.getenv("AI_RETRY_BUDGET_SECONDS", "15"))
+
+# Circuit breaker configuration
+AI_BREAKER_FAILURE_THRESHOLD = int(os.getenv("AI_BREAKER_FAILURE_THRESHOLD", "5"))
+AI_BREAKER_RECOVERY_SECONDS = float(os.getenv("AI_BREAKER_RECOVERY_SECONDS", "30"))
+
+# Circuit breaker states
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# allow_request() token for calls made while the breaker is closed (nothing to release)
+CLOSED_CALL = object()
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Seconds to wait according to the Retry-After header of an HTTP error, if any"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    
+    # Retry-After may also be an HTTP date
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a per-call sleep budget"""
+    
+    def __init__(
+        self,
+        max_retries: int = AI_MAX_RETRIES,
+        base_delay: float = AI_RETRY_BASE_DELAY,
+        max_delay: float = AI_RETRY_MAX_DELAY,
+        budget_seconds: float = AI_RETRY_BUDGET_SECONDS
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_seconds = budget_seconds
+    
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number `attempt` (0-based); Retry-After takes precedence when given"""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency until a recovery timeout has passed"""
+    
+    def __init__(
+        self,
+        failure_threshold: int = AI_BREAKER_FAILURE_THRESHOLD,
+        recovery_seconds: float = AI_BREAKER_RECOVERY_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        # Token of the half-open trial call in flight, if any
+        self._trial_token: Optional[object] = None
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.recovery_seconds:
+            self._state = STATE_HALF_OPEN
+            self._trial_token = None
+        return self._state
+    
+    def is_open(self) -> bool:
+        """Whether new calls would be turned away (open, or half-open awaiting a trial); takes no slot"""
+        with self._lock:
+            return self._current_state() != STATE_CLOSED
+    
+    def allow_request(self) -> Optional[object]:
+        """
+        Token for a call that may go through, or None if it is rejected
+        
+        In half-open state only one trial call is let through; its token is the
+        only one release_trial() accepts.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                return CLOSED_CALL
+            if state == STATE_HALF_OPEN and self._trial_token is None:
+                self._trial_token = object()
+                return self._trial_token
+            self._rejected += 1
+            return None
+    
+    def record_success(self):
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                logger.info("Circuit breaker closed")
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._trial_token = None
+    
+    def release_trial(self, token: Optional[object]):
+        """End a half-open trial whose outcome was not recorded (rate-limit timeout, cancellation)"""
+        with self._lock:
+            # Only the caller holding the current trial can free it
+            if token is not None and token is self._trial_token:
+                self._trial_token = None
+    
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == STATE_HALF_OPEN or (
+                state == STATE_CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._trial_token = None
+                self._times_opened += 1
+                logger.warning(f"Circuit breaker opened after {self._consecutive_failures} consecutive failures")
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self._times_opened,
+                "rejected_calls": self._rejected
+            }
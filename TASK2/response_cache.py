@@ -0,0 +1,236 @@
+"""
+Response cache for the hot admin reads (/api/analytics, /api/reviews/priority)
+Stores serialized JSON bodies, so a hit skips the database, the response models
+and JSON encoding. Entries are tagged with a generation that advances after every
+committed write (see rollups.bump_version), so a cached body is never served
+once a newer write has committed; TTL bounds time-based drift such as the
+last-24h count and urgency decay.
+
+With RESPONSE_CACHE_SQLITE_PATH set, bodies and the generation live in a SQLite
+file shared by every worker on the host, so a write in one worker invalidates all.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+# Upper bound on how long a body is served without a write invalidating it
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+# Optional tier shared by all workers on the host (disabled when empty)
+RESPONSE_CACHE_SQLITE_PATH = os.getenv("RESPONSE_CACHE_SQLITE_PATH", "")
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[datetime]
+    created_at: float
+    expires_at: float
+    generation: int
+
+
+class ResponseCache:
+    """Generation-checked LRU of response bodies with an optional shared SQLite tier"""
+
+    def __init__(
+        self,
+        enabled: bool = RESPONSE_CACHE_ENABLED,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        sqlite_path: str = RESPONSE_CACHE_SQLITE_PATH
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+        self._hit_age_total = 0.0
+        self._hit_age_max = 0.0
+        self._last_invalidation: Optional[float] = None
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        if enabled and sqlite_path:
+            self._open_sqlite(sqlite_path)
+
+    def _open_sqlite(self, path: str):
+        try:
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=5, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL, generation INTEGER NOT NULL)"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS response_cache_generation (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)")
+            self._db.execute("INSERT OR IGNORE INTO response_cache_generation (id, value) VALUES (1, 0)")
+        except sqlite3.Error as e:
+            logger.error(f"Shared response cache disabled: {str(e)}")
+            self._db = None
+
+    def generation(self) -> int:
+        """Current generation; entries from older generations are never served"""
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    row = self._db.execute("SELECT value FROM response_cache_generation WHERE id = 1").fetchone()
+                return row[0]
+            except sqlite3.Error as e:
+                logger.error(f"Shared response cache read failed: {str(e)}")
+        return self._generation
+
+    def lookup(self, key: str) -> Tuple[Optional[CachedResponse], int]:
+        """Returns (fresh entry or None, generation to store a freshly built body under)"""
+        if not self.enabled:
+            return None, 0
+
+        generation = self.generation()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.generation == generation and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self._record_hit(entry, now)
+                self._hits += 1
+                return entry, generation
+
+        entry = self._get_shared(key, generation, now)
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None, generation
+            self._record_hit(entry, now)
+            self._shared_hits += 1
+        self._set_memory(key, entry)
+        return entry, generation
+
+    def store(self, key: str, generation: int, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[datetime] = None) -> CachedResponse:
+        """
+        Cache a body built after lookup() returned `generation`
+
+        If a write committed meanwhile the generation has moved on and the entry is
+        simply never served
+        """
+        now = time.time()
+        entry = CachedResponse(body, etag, last_modified, now, now + self.ttl_seconds, generation)
+        if self.enabled:
+            self._set_memory(key, entry)
+            self._set_shared(key, entry)
+        return entry
+
+    def invalidate(self):
+        """Retire every cached body; called after each committed write"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            self._last_invalidation = time.time()
+            # Stale entries would never be served again; free them now
+            self._entries.clear()
+
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute("UPDATE response_cache_generation SET value = value + 1 WHERE id = 1")
+                    self._db.execute(
+                        "DELETE FROM response_cache WHERE generation < (SELECT value FROM response_cache_generation WHERE id = 1)"
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Shared response cache invalidation failed: {str(e)}")
+
+    def stats(self) -> dict:
+        """Hit ratio, size and how stale the served bodies were"""
+        generation = self.generation()
+        with self._lock:
+            served = self._hits + self._shared_hits
+            lookups = served + self._misses
+            return {
+                "enabled": self.enabled,
+                "shared": self._db is not None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "generation": generation,
+                "hits": self._hits,
+                "shared_hits": self._shared_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_ratio": round(served / lookups, 4) if lookups else 0.0,
+                # Age of the body at the moment it was served
+                "avg_hit_age_seconds": round(self._hit_age_total / served, 3) if served else 0.0,
+                "max_hit_age_seconds": round(self._hit_age_max, 3),
+                "seconds_since_invalidation": round(time.time() - self._last_invalidation, 3) if self._last_invalidation else None
+            }
+
+    def _record_hit(self, entry: CachedResponse, now: float):
+        """Caller holds _lock"""
+        age = now - entry.created_at
+        self._hit_age_total += age
+        self._hit_age_max = max(self._hit_age_max, age)
+
+    def _set_memory(self, key: str, entry: CachedResponse):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _get_shared(self, key: str, generation: int, now: float) -> Optional[CachedResponse]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT body, etag, last_modified, created_at, expires_at FROM response_cache "
+                    "WHERE key = ? AND generation = ? AND expires_at > ?", (key, generation, now)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Shared response cache read failed: {str(e)}")
+            return None
+        if row is None:
+            return None
+        body, etag, last_modified, created_at, expires_at = row
+        return CachedResponse(
+            bytes(body), etag, datetime.fromisoformat(last_modified) if last_modified else None,
+            created_at, expires_at, generation
+        )
+
+    def _set_shared(self, key: str, entry: CachedResponse):
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, body, etag, last_modified, created_at, expires_at, generation) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, entry.body, entry.etag, entry.last_modified.isoformat() if entry.last_modified else None,
+                     entry.created_at, entry.expires_at, entry.generation)
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Shared response cache write failed: {str(e)}")
+
+
+# Singleton instance
+response_cache = ResponseCache()
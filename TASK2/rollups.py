@@ -0,0 +1,192 @@
+"""
+Incrementally maintained analytics rollups
+Per-rating counts and hourly/daily buckets are updated in the same transaction
+as each review insert, so /api/analytics reads a handful of rows instead of
+scanning the reviews table. The reviews data version (see http_cache.py) is
+bumped alongside them, and the response cache is invalidated once that
+transaction commits.
+
+Usage: python rollups.py rebuild
+"""
+
+import sys
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import SessionLocal, Review, ReviewRatingRollup, ReviewTimeBucket, DataVersion
+from response_cache import response_cache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+GRANULARITY_HOUR = "hour"
+GRANULARITY_DAY = "day"
+
+# DataVersion row covering the reviews table and everything derived from it
+REVIEWS_VERSION = "reviews"
+# Session.info flag set by bump_version until the transaction ends
+REVIEWS_CHANGED = "reviews_changed"
+
+
+def _bucket_start(created_at: datetime, granularity: str) -> datetime:
+    if granularity == GRANULARITY_DAY:
+        return created_at.replace(hour=0, minute=0, second=0, microsecond=0)
+    return created_at.replace(minute=0, second=0, microsecond=0)
+
+
+def _aggregate(reviews: Iterable[Tuple[int, datetime]]):
+    """Group (rating, created_at) pairs into per-rating and per-bucket [count, rating_sum] totals"""
+    by_rating = defaultdict(lambda: [0, 0])
+    by_bucket = defaultdict(lambda: [0, 0])
+    for rating, created_at in reviews:
+        by_rating[rating][0] += 1
+        by_rating[rating][1] += rating
+        for granularity in (GRANULARITY_HOUR, GRANULARITY_DAY):
+            totals = by_bucket[(granularity, _bucket_start(created_at, granularity))]
+            totals[0] += 1
+            totals[1] += rating
+    return by_rating, by_bucket
+
+
+def _increment(db: Session, model, key: dict, count: int, rating_sum: int):
+    """Add to a rollup row, creating it if needed"""
+    values = {
+        model.review_count: model.review_count + count,
+        model.rating_sum: model.rating_sum + rating_sum
+    }
+    if db.query(model).filter_by(**key).update(values, synchronize_session=False):
+        return
+    
+    try:
+        with db.begin_nested():
+            db.add(model(**key, review_count=count, rating_sum=rating_sum))
+    except IntegrityError:
+        # A concurrent transaction created the row first
+        db.query(model).filter_by(**key).update(values, synchronize_session=False)
+
+
+def bump_version(db: Session):
+    """Mark the reviews data as changed; call inside the transaction that changes it"""
+    db.info[REVIEWS_CHANGED] = True
+    values = {DataVersion.version: DataVersion.version + 1, DataVersion.updated_at: datetime.utcnow()}
+    if db.query(DataVersion).filter_by(name=REVIEWS_VERSION).update(values, synchronize_session=False):
+        return
+    
+    try:
+        with db.begin_nested():
+            db.add(DataVersion(name=REVIEWS_VERSION, version=1, updated_at=datetime.utcnow()))
+    except IntegrityError:
+        db.query(DataVersion).filter_by(name=REVIEWS_VERSION).update(values, synchronize_session=False)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_response_cache(session):
+    # Only after commit: a body rebuilt meanwhile never sees uncommitted rows
+    if session.info.pop(REVIEWS_CHANGED, False):
+        response_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changes(session):
+    session.info.pop(REVIEWS_CHANGED, None)
+
+
+def read_version(db: Session) -> Tuple[int, Optional[datetime]]:
+    """(version, last change time) of the reviews data"""
+    row = db.query(DataVersion.version, DataVersion.updated_at).filter(DataVersion.name == REVIEWS_VERSION).first()
+    return (row.version, row.updated_at) if row else (0, None)
+
+
+def record_reviews(db: Session, reviews: Iterable[Tuple[int, datetime]]):
+    """Add new reviews to the rollups; call inside the transaction that inserts them"""
+    bump_version(db)
+    by_rating, by_bucket = _aggregate(reviews)
+    for rating, (count, rating_sum) in by_rating.items():
+        _increment(db, ReviewRatingRollup, {"rating": rating}, count, rating_sum)
+    for (granularity, bucket_start), (count, rating_sum) in by_bucket.items():
+        _increment(db, ReviewTimeBucket, {"granularity": granularity, "bucket_start": bucket_start}, count, rating_sum)
+
+
+def record_review(db: Session, rating: int, created_at: datetime):
+    """Add a single new review to the rollups"""
+    record_reviews(db, [(rating, created_at)])
+
+
+def count_reviews(db: Session, rating: int = None) -> int:
+    """Exact review count (optionally for one rating) from the rollups"""
+    query = db.query(func.coalesce(func.sum(ReviewRatingRollup.review_count), 0))
+    if rating is not None:
+        query = query.filter(ReviewRatingRollup.rating == rating)
+    return int(query.scalar())
+
+
+def read_analytics(db: Session, now: datetime = None) -> dict:
+    """Totals, average, distribution and last-24h count from the rollups"""
+    now = now or datetime.utcnow()
+    
+    rating_distribution = {rating: 0 for rating in range(1, 6)}
+    total_reviews = 0
+    rating_sum = 0
+    for row in db.query(ReviewRatingRollup).all():
+        rating_distribution[row.rating] = row.review_count
+        total_reviews += row.review_count
+        rating_sum += row.rating_sum
+    
+    # Whole hours inside the window come from the hourly buckets...
+    yesterday = now - timedelta(days=1)
+    first_full_hour = _bucket_start(yesterday, GRANULARITY_HOUR) + timedelta(hours=1)
+    recent_count = db.query(func.coalesce(func.sum(ReviewTimeBucket.review_count), 0)).filter(
+        ReviewTimeBucket.granularity == GRANULARITY_HOUR,
+        ReviewTimeBucket.bucket_start >= first_full_hour
+    ).scalar()
+    # ...and the partial hour at the start of the window from a bounded index range
+    recent_count += db.query(func.count(Review.id)).filter(
+        Review.created_at >= yesterday,
+        Review.created_at < first_full_hour
+    ).scalar()
+    
+    return {
+        "total_reviews": total_reviews,
+        "average_rating": round(rating_sum / total_reviews, 2) if total_reviews else 0.0,
+        "rating_distribution": rating_distribution,
+        "recent_reviews_count": int(recent_count)
+    }
+
+
+def rebuild_rollups(db: Session, batch_size: int = 10000):
+    """Recompute every rollup from the reviews table (run while submissions are paused)"""
+    db.query(ReviewRatingRollup).delete(synchronize_session=False)
+    db.query(ReviewTimeBucket).delete(synchronize_session=False)
+    
+    rows = db.query(Review.rating, Review.created_at).execution_options(yield_per=batch_size)
+    by_rating, by_bucket = _aggregate(rows)
+    
+    for rating in range(1, 6):
+        count, rating_sum = by_rating.get(rating, (0, 0))
+        db.add(ReviewRatingRollup(rating=rating, review_count=count, rating_sum=rating_sum))
+    for (granularity, bucket_start), (count, rating_sum) in by_bucket.items():
+        db.add(ReviewTimeBucket(granularity=granularity, bucket_start=bucket_start, review_count=count, rating_sum=rating_sum))
+    
+    bump_version(db)
+    db.commit()
+    logger.info(f"Rollups rebuilt from {sum(count for count, _ in by_rating.values())} reviews")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] != "rebuild":
+        sys.exit("Usage: python rollups.py rebuild")
+    
+    from database import init_db
+    init_db()
+    session = SessionLocal()
+    try:
+        rebuild_rollups(session)
+    finally:
+        session.close()
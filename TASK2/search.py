@@ -0,0 +1,115 @@
+"""
+Full-text search over review_text and summary
+SQLite uses the reviews_fts FTS5 table and Postgres the search_vector tsvector
+column. Both are created by migration 005 and kept in sync by the database
+itself (triggers / generated column), so every insert path is indexed.
+
+Usage: python search.py rebuild   (SQLite: re-index, e.g. after a VACUUM)
+"""
+
+import re
+import sys
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, literal_column, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import table, column
+
+from database import Review
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+# Words, optionally with a trailing * for prefix search
+SEARCH_TERM = re.compile(r"\w+\*?", re.UNICODE)
+
+reviews_fts = table("reviews_fts", column("rowid"))
+
+
+def is_supported(db: Session) -> bool:
+    return db.get_bind().dialect.name in SUPPORTED_DIALECTS
+
+
+def is_searchable(query: str) -> bool:
+    """True if the query contains at least one word"""
+    return bool(SEARCH_TERM.search(query or ""))
+
+
+def fts5_query(query: str) -> str:
+    """Quote each word so user input cannot break FTS5 syntax; all words must match"""
+    terms = []
+    for term in SEARCH_TERM.findall(query):
+        word = term.rstrip("*")
+        terms.append(f'"{word}"*' if term.endswith("*") else f'"{word}"')
+    return " ".join(terms)
+
+
+def search_reviews(
+    db: Session,
+    query: str,
+    rating: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0,
+    include_total: bool = True
+) -> Tuple[List[Tuple[Review, float]], Optional[int]]:
+    """
+    Ranked matches for `query` with optional rating/date filters
+    Returns ([(review, score)], total); higher scores are better matches
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = func.websearch_to_tsquery("english", query)
+        vector = literal_column("reviews.search_vector")
+        score = func.ts_rank_cd(vector, tsquery)
+        matches = db.query(Review).filter(vector.op("@@")(tsquery))
+    else:
+        # bm25() is lower-is-better; review_text weighs twice as much as the summary
+        score = -func.bm25(literal_column("reviews_fts"), 2.0, 1.0)
+        matches = db.query(Review).join(
+            reviews_fts, reviews_fts.c.rowid == literal_column("reviews.rowid")
+        ).filter(literal_column("reviews_fts").op("MATCH")(fts5_query(query)))
+
+    if rating is not None:
+        matches = matches.filter(Review.rating == rating)
+    if created_after is not None:
+        matches = matches.filter(Review.created_at >= created_after)
+    if created_before is not None:
+        matches = matches.filter(Review.created_at < created_before)
+
+    total = matches.count() if include_total else None
+
+    rows = matches.add_columns(score.label("score")).order_by(
+        score.desc(), Review.created_at.desc(), Review.id.desc()
+    ).offset(offset).limit(limit).all()
+
+    return [(review, float(row_score or 0)) for review, row_score in rows], total
+
+
+def rebuild_index(db: Session):
+    """Re-index every review (SQLite FTS5 only; the Postgres column maintains itself)"""
+    if db.get_bind().dialect.name != "sqlite":
+        logger.info("Search index is a generated column; nothing to rebuild")
+        return
+    db.execute(text("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')"))
+    db.commit()
+    logger.info("Search index rebuilt")
+
+
+if __name__ == "__main__":
+    from database import SessionLocal, init_db
+
+    if len(sys.argv) < 2 or sys.argv[1] != "rebuild":
+        sys.exit("Usage: python search.py rebuild")
+
+    init_db()
+    db = SessionLocal()
+    try:
+        rebuild_index(db)
+    finally:
+        db.close()
@@ -25,7 +25,7 @@ def test_submit_reviews():
     for review in test_reviews:
         try:
             response = requests.post(f"{BASE_URL}/api/reviews", json=review)
-            if response.status_code == 200:
+            if response.status_code in (200, 202):
                 data = response.json()
                 print(f"✓ Submitted {review['rating']}-star review (ID: {data['id'][:8]}...)")
             else:
@@ -34,6 +34,32 @@ def test_submit_reviews():
             print(f"✗ Error: {str(e)}")
 
 
+def test_batch_submit():
+    """Submit a batch with one invalid item"""
+    print("\n" + "="*60)
+    print("Testing: Batch Submit Endpoint")
+    print("="*60)
+    
+    batch = [
+        {"name": "Batch One", "rating": 3, "review_text": "Average experience, nothing special but nothing wrong either."},
+        {"name": "Batch Two", "rating": 5, "review_text": "Lovely staff and quick delivery, will order again."},
+        {"name": "Batch Bad", "rating": 7, "review_text": "short"},
+    ]
+    
+    try:
+        response = requests.post(f"{BASE_URL}/api/reviews/batch", json=batch)
+        if response.status_code in (200, 202):
+            data = response.json()
+            print(f"✓ Batch endpoint working! {data['succeeded']} saved, {data['failed']} failed")
+            for result in data['results']:
+                print(f"    - item {result['index']}: {result['status']} {result['error'] or ''}")
+        else:
+            print(f"✗ Failed: {response.status_code}")
+            print(f"  Response: {response.text}")
+    except Exception as e:
+        print(f"✗ Error: {str(e)}")
+
+
 def test_priority_queue():
     """Test the priority queue endpoint"""
     print("\n" + "="*60)
@@ -52,7 +78,7 @@ def test_priority_queue():
             if data['urgent_reviews']:
                 print("\n  Urgent Reviews:")
                 for review in data['urgent_reviews'][:3]:  # Show first 3
-                    print(f"    - {review['rating']}⭐: {review['review_text'][:50]}...")
+                    print(f"    - {review['rating']}⭐ (urgency {review['urgency']}): {review['review_text'][:50]}...")
         else:
             print(f"✗ Failed: {response.status_code}")
             print(f"  Response: {response.text}")
@@ -131,6 +157,7 @@ if __name__ == "__main__":
     
     # Run tests
     test_submit_reviews()
+    test_batch_submit()
     test_all_endpoints()
     test_priority_queue()
     test_export()
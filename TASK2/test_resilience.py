@@ -0,0 +1,123 @@
+"""
+Circuit breaker regression checks for AIService
+A half-open trial call that ends without a success or failure (client-side
+rate-limit timeout, cancellation) must free the trial slot again, and only the
+caller holding the trial may free it:
+    python test_resilience.py   (or: pytest test_resilience.py)
+"""
+
+import os
+import sys
+import asyncio
+
+# Offline LLM and no response cache before the app modules are imported
+os.environ["LLM_BACKEND"] = "stub"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_service import AIService
+from llm_backends import RateLimitTimeout
+from resilience import CircuitBreaker, RetryPolicy, CLOSED_CALL, STATE_HALF_OPEN
+
+
+class RateLimitedBackend:
+    """Backend whose client-side rate limiter never grants quota"""
+    name = "rate-limited"
+
+    def complete(self, prompt, model, temperature):
+        raise RateLimitTimeout("No Groq quota within 0.0s")
+
+    async def acomplete(self, prompt, model, temperature):
+        raise RateLimitTimeout("No Groq quota within 0.0s")
+
+
+class FailingBackend:
+    """Backend whose calls always fail with a retryable server error"""
+    name = "failing"
+
+    def complete(self, prompt, model, temperature):
+        raise RuntimeError("503 Service Unavailable")
+
+
+class HangingBackend:
+    """Backend whose calls never return, so they can be cancelled mid-flight"""
+    name = "hanging"
+
+    async def acomplete(self, prompt, model, temperature):
+        await asyncio.sleep(3600)
+
+
+def half_open_service(llm_backend) -> AIService:
+    """AIService whose breaker is half-open and will let one trial call through"""
+    service = AIService(llm_backend)
+    service.breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0)
+    service.breaker.record_failure()
+    assert service.breaker.state == STATE_HALF_OPEN
+    return service
+
+
+def test_rate_limit_timeout_releases_trial():
+    service = half_open_service(RateLimitedBackend())
+    assert service._request_completion("prompt") is None
+    # Without release_trial() the next call would be short-circuited forever
+    assert service.breaker.allow_request()
+
+
+def test_async_rate_limit_timeout_releases_trial():
+    service = half_open_service(RateLimitedBackend())
+    assert asyncio.run(service._arequest_completion("prompt")) is None
+    assert service.breaker.allow_request()
+
+
+def test_cancelled_trial_releases_trial():
+    service = half_open_service(HangingBackend())
+
+    async def cancel_trial():
+        task = asyncio.create_task(service._arequest_completion("prompt"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(cancel_trial())
+    assert service.breaker.allow_request()
+
+
+def test_only_trial_holder_releases_trial():
+    breaker = half_open_service(RateLimitedBackend()).breaker
+    token = breaker.allow_request()
+    assert token and breaker.allow_request() is None
+    # Callers that never held this trial (closed-state calls, rejected calls, old trials)
+    for other in (CLOSED_CALL, None, object()):
+        breaker.release_trial(other)
+        assert breaker.allow_request() is None
+    breaker.release_trial(token)
+    assert breaker.allow_request()
+
+
+def test_is_open_takes_no_trial_slot():
+    breaker = half_open_service(RateLimitedBackend()).breaker
+    assert breaker.is_open() and breaker.is_open()
+    assert breaker.stats()["rejected_calls"] == 0
+    assert breaker.allow_request()
+
+
+def test_retries_do_not_count_as_rejected():
+    service = AIService(FailingBackend())
+    service.breaker = CircuitBreaker(failure_threshold=10, recovery_seconds=60)
+    service.retry_policy = RetryPolicy(base_delay=0.001, max_delay=0.001)
+    assert service._request_completion("prompt") is None
+    assert service._counters["retries"] == service.max_retries
+    assert service.breaker.stats()["rejected_calls"] == 0
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Testing: Circuit breaker trial release")
+    print("="*60)
+    for test in (test_rate_limit_timeout_releases_trial, test_async_rate_limit_timeout_releases_trial, test_cancelled_trial_releases_trial,
+                 test_only_trial_holder_releases_trial, test_is_open_takes_no_trial_slot, test_retries_do_not_count_as_rejected):
+        test()
+        print(f"✓ {test.__name__}")
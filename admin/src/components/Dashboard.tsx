@@ -9,6 +9,14 @@ export function Dashboard() {
 
   useEffect(() => {
     fetchAnalytics();
+
+    // Apply each new review to the totals instead of re-fetching analytics
+    return api.subscribeToEvents({
+      onCreated: ({ analytics_delta: { rating, count } }) => {
+        setAnalytics((current) => current && applyReviewDelta(current, rating, count));
+      },
+      onResync: fetchAnalytics,
+    });
   }, []);
 
   const fetchAnalytics = async () => {
@@ -111,6 +119,21 @@ export function Dashboard() {
   );
 }
 
+function applyReviewDelta(analytics: Analytics, rating: number, count: number): Analytics {
+  const total = analytics.total_reviews + count;
+  return {
+    total_reviews: total,
+    average_rating: total > 0
+      ? (analytics.average_rating * analytics.total_reviews + rating * count) / total
+      : 0,
+    rating_distribution: {
+      ...analytics.rating_distribution,
+      [rating]: (analytics.rating_distribution[rating] ?? 0) + count,
+    },
+    recent_reviews_count: analytics.recent_reviews_count + count,
+  };
+}
+
 interface StatCardProps {
   icon: React.ReactNode;
   label: string;
@@ -1,20 +1,38 @@
 import { useEffect, useState } from 'react';
 import { api } from '../lib/api';
-import { AdminReviewItem } from '../types/api';
+import { PriorityReviewItem, ReviewEventItem } from '../types/api';
 import { AlertTriangle, Star, Calendar } from 'lucide-react';
 
+const PRIORITY_LIMIT = 20;
+
 export function PriorityReviews() {
-  const [urgentReviews, setUrgentReviews] = useState<AdminReviewItem[]>([]);
+  const [urgentReviews, setUrgentReviews] = useState<PriorityReviewItem[]>([]);
   const [totalUrgent, setTotalUrgent] = useState(0);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     fetchPriorityReviews();
+
+    // Merge pushed reviews into the list instead of polling the priority endpoint
+    return api.subscribeToEvents({
+      onCreated: ({ review }) => {
+        if (!review.urgent) return;
+        setUrgentReviews((current) => mergeByUrgency(current, review));
+        setTotalUrgent((count) => count + 1);
+      },
+      onUpdated: ({ review }) => {
+        // Enrichment adds the LLM severity, which can move a review within the queue
+        setUrgentReviews((current) => review.urgent
+          ? mergeByUrgency(current, review)
+          : current.filter((item) => item.id !== review.id));
+      },
+      onResync: fetchPriorityReviews,
+    });
   }, []);
 
   const fetchPriorityReviews = async () => {
     try {
-      const data = await api.getPriorityReviews(20);
+      const data = await api.getPriorityReviews(PRIORITY_LIMIT);
       setUrgentReviews(data.urgent_reviews);
       setTotalUrgent(data.total_urgent);
     } catch (error) {
@@ -41,7 +59,7 @@ export function PriorityReviews() {
             {totalUrgent} {totalUrgent === 1 ? 'review' : 'reviews'} requiring immediate attention
           </p>
           <p className="text-sm text-red-700">
-            These are 1-2 star reviews that may need follow-up action
+            Ranked by urgency: rating, severity and refund, safety or legal issues, fading with age
           </p>
         </div>
       </div>
@@ -61,7 +79,14 @@ export function PriorityReviews() {
   );
 }
 
-function UrgentReviewCard({ review }: { review: AdminReviewItem }) {
+function mergeByUrgency(reviews: PriorityReviewItem[], review: ReviewEventItem): PriorityReviewItem[] {
+  const item: PriorityReviewItem = { ...review, urgency: review.urgency ?? 0 };
+  return [...reviews.filter((existing) => existing.id !== review.id), item]
+    .sort((a, b) => b.urgency - a.urgency)
+    .slice(0, PRIORITY_LIMIT);
+}
+
+function UrgentReviewCard({ review }: { review: PriorityReviewItem }) {
   return (
     <div className="bg-white rounded-xl shadow-sm border-2 border-red-200 p-6 hover:shadow-md transition">
       <div className="flex items-start justify-between mb-4">
@@ -82,6 +107,9 @@ function UrgentReviewCard({ review }: { review: AdminReviewItem }) {
           </div>
         </div>
         <div className="flex items-center gap-2 text-sm text-slate-600">
+          <span className="bg-red-100 text-red-800 font-semibold px-2 py-0.5 rounded">
+            Urgency {Math.round(review.urgency)}
+          </span>
           <Calendar className="w-4 h-4" />
           {new Date(review.created_at).toLocaleDateString('en-US', {
             year: 'numeric',
@@ -2,6 +2,7 @@ import type {
     AdminReviewsResponse,
     Analytics,
     PriorityReviewsResponse,
+    ReviewEventHandlers,
 } from '../types/api';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
@@ -56,4 +57,19 @@ export const api = {
 
         return response.blob();
     },
+
+    // Push feed of new and enriched reviews; returns a function that closes the stream
+    subscribeToEvents(handlers: ReviewEventHandlers): () => void {
+        const source = new EventSource(`${API_BASE_URL}/api/events`);
+
+        source.addEventListener('review.created', (event) => {
+            handlers.onCreated?.(JSON.parse((event as MessageEvent).data));
+        });
+        source.addEventListener('review.updated', (event) => {
+            handlers.onUpdated?.(JSON.parse((event as MessageEvent).data));
+        });
+        source.addEventListener('resync', () => handlers.onResync?.());
+
+        return () => source.close();
+    },
 };
@@ -38,8 +38,38 @@ export interface Analytics {
     recent_reviews_count: number;
 }
 
+export interface PriorityReviewItem extends AdminReviewItem {
+    severity: number | null;
+    urgency: number;
+}
+
 export interface PriorityReviewsResponse {
-    urgent_reviews: AdminReviewItem[];
+    urgent_reviews: PriorityReviewItem[];
     total_urgent: number;
     message: string;
 }
+
+// Live feed (GET /api/events)
+
+export interface ReviewEventItem extends AdminReviewItem {
+    status: string | null;
+    severity: number | null;
+    urgency: number | null;
+    urgent: boolean;
+}
+
+export interface ReviewCreatedEvent {
+    review: ReviewEventItem;
+    analytics_delta: { rating: number; count: number };
+}
+
+export interface ReviewUpdatedEvent {
+    review: ReviewEventItem;
+}
+
+export interface ReviewEventHandlers {
+    onCreated?: (event: ReviewCreatedEvent) => void;
+    onUpdated?: (event: ReviewUpdatedEvent) => void;
+    // Events were missed; reload from the REST endpoints
+    onResync?: () => void;
+}